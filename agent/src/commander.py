@@ -10,10 +10,14 @@ position or execute an avoidance maneuver.
 Two execution paths (selected automatically):
   1. **Blaxel SDK** (``BLModel``) — preferred when ``blaxel`` is installed
      and ``BL_WORKSPACE`` is configured.  Gives automatic telemetry,
-     token refresh, and deployment compatibility.
+     token refresh, and deployment compatibility.  The resolved gateway is
+     called with a direct ``/chat/completions`` POST over a pooled client.
   2. **Direct OpenAI client** — fallback that uses ``httpx`` to inject
      Blaxel's non-standard auth headers manually.
 
+Clear-cut telemetry (no optical input, probability far from the 0.7 action
+threshold) is decided locally by a rule-based fast path without an LLM call.
+
 Usage (standalone test):
     python -m agent.src.commander
 """
@@ -21,15 +25,22 @@ Usage (standalone test):
 from __future__ import annotations
 
 import asyncio
+import atexit
+import hashlib
 import json
 import logging
 import os
-import re
+import random
+import sys
+import threading
 import time
+from collections import OrderedDict
 
 import httpx
+import orjson
 from dotenv import load_dotenv
-from openai import OpenAI
+
+from agent.src.learning_engine import count, record_event
 
 # ---------------------------------------------------------------------------
 # Environment & API configuration
@@ -44,6 +55,9 @@ BLAXEL_MODEL_NAME: str = os.getenv("BLAXEL_MODEL_NAME", "sandbox-openai")
 BLAXEL_MODEL_BASE_URL: str = (
     f"https://run.blaxel.ai/{BLAXEL_WORKSPACE}/models/{BLAXEL_MODEL_NAME}/v1"
 )
+# Routing key for provider-side prompt caching of the static system prompt.
+# Bump the suffix whenever SYSTEM_PROMPT changes.
+PROMPT_CACHE_KEY: str = os.getenv("COMMANDER_PROMPT_CACHE_KEY", "vyuha-sys-v2")
 
 # ---------------------------------------------------------------------------
 # Path 1 — Blaxel SDK (preferred)
@@ -59,51 +73,138 @@ except Exception:
 # ---------------------------------------------------------------------------
 # Path 2 — Direct OpenAI client via custom httpx (fallback)
 # ---------------------------------------------------------------------------
-_http_client = httpx.Client(
-    headers={
-        "X-Blaxel-Authorization": f"Bearer {BLAXEL_API_KEY}",
-        "X-Blaxel-Workspace": BLAXEL_WORKSPACE,
-    },
-    timeout=30.0,
-)
-
-_openai_client = OpenAI(
-    api_key=BLAXEL_API_KEY,
-    base_url=BLAXEL_MODEL_BASE_URL,
-    http_client=_http_client,
-)
+# The OpenAI SDK takes ~0.4 s to import and the hot path posts through httpx
+# directly, so the SDK is only loaded when the fallback is used.
+_openai_client = None
+_OPENAI_LOCK = threading.Lock()
+
+
+def _get_openai_client():
+    """Return the direct OpenAI client, importing the SDK on first use."""
+    global _openai_client
+    if _openai_client is None:
+        with _OPENAI_LOCK:
+            if _openai_client is None:
+                from openai import OpenAI
+
+                _openai_client = OpenAI(
+                    api_key=BLAXEL_API_KEY,
+                    base_url=BLAXEL_MODEL_BASE_URL,
+                    http_client=httpx.Client(
+                        headers={
+                            "X-Blaxel-Authorization": f"Bearer {BLAXEL_API_KEY}",
+                            "X-Blaxel-Workspace": BLAXEL_WORKSPACE,
+                        },
+                        timeout=30.0,
+                    ),
+                )
+    return _openai_client
 
 # ---------------------------------------------------------------------------
 # System prompt — governs Vyuha's decision logic
 # ---------------------------------------------------------------------------
+# Kept deliberately short: the JSON shape is enforced by the response schema
+# and clear-cut probabilities never reach the model (see the fast path), so
+# the prompt only carries the judgement rules.
 SYSTEM_PROMPT = """\
-You are Vyuha, an autonomous satellite defense commander.
-Your top priority is collision avoidance.
-
-You now have access to TWO sensor modalities:
-  1. Telemetry (Orbit Engine) — altitude, collision probability, status.
-  2. Optical Sensors (Visual Analysis) — description of the onboard camera feed.
-
-RULES:
-1. If collision_probability > 0.7 you MUST recommend action "FIRE_THRUSTERS".
-2. If collision_probability <= 0.7 you MUST recommend action "HOLD_POSITION".
-3. If Visual Analysis confirms debris or a collision risk, INCREASE your
-   confidence_score and cite "Optical Confirmation" in your reasoning.
-4. Explain your reasoning clearly in exactly one sentence.
-
-OUTPUT FORMAT:
-You must respond with strictly valid JSON — no Markdown fences, no comments,
-no extra text before or after the JSON object.
-
-JSON SCHEMA:
-{
-  "action": "FIRE_THRUSTERS" | "HOLD_POSITION",
-  "reasoning": "<one-sentence explanation>",
-  "confidence_score": <float between 0.0 and 1.0>,
-  "recommended_thrust_direction": "PROGRADE" | "RETROGRADE" | "NONE"
-}
+You are Vyuha, an autonomous satellite collision-avoidance commander.
+Inputs: orbit telemetry and an optical sensor description.
+- action: FIRE_THRUSTERS if collision_probability > 0.7, else HOLD_POSITION.
+- If the optical description confirms debris, raise confidence_score and \
+cite "Optical Confirmation".
+- reasoning: exactly one sentence.
+Reply with the JSON decision object only.
 """
 
+# ---------------------------------------------------------------------------
+# Static request scaffolding — built once, reused by every Commander call
+# ---------------------------------------------------------------------------
+# The system prompt always leads the message list and never contains dynamic
+# data, so OpenAI-compatible gateways can serve it from their prefix cache;
+# only the short telemetry user message is prefilled at full cost.
+_SYSTEM_MESSAGE: dict = {"role": "system", "content": SYSTEM_PROMPT}
+
+# Structured-output schema for the decision object. Constraining the decoder
+# to exactly these four fields (with a capped reasoning length) lets it stop
+# as soon as the object closes, so a small token budget is enough.
+_DECISION_SCHEMA: dict = {
+    "type": "object",
+    "required": [
+        "action",
+        "reasoning",
+        "confidence_score",
+        "recommended_thrust_direction",
+    ],
+    "properties": {
+        "action": {"enum": ["FIRE_THRUSTERS", "HOLD_POSITION"]},
+        "reasoning": {"type": "string", "maxLength": 200},
+        "confidence_score": {"type": "number"},
+        "recommended_thrust_direction": {
+            "enum": ["PROGRADE", "RETROGRADE", "NONE"],
+        },
+    },
+}
+
+# Wire-format body fields shared by the direct POST and the SDK fallback.
+_COMPLETION_PARAMS: dict = {
+    "temperature": 0.2,
+    "max_tokens": 96,
+    "response_format": {
+        "type": "json_schema",
+        "json_schema": {"name": "decision", "schema": _DECISION_SCHEMA},
+    },
+    "prompt_cache_key": PROMPT_CACHE_KEY,
+}
+_DEFAULT_LLM_MODEL = "gpt-4o-mini"
+
+# Per-call user prompt; only the four telemetry/visual fields vary.
+_USER_TEMPLATE = (
+    "Satellite telemetry update:\n"
+    "  • Altitude:              {alt} km\n"
+    "  • Collision Probability: {p}\n"
+    "  • Current Status:        {s}\n\n"
+    "Optical sensor analysis:\n"
+    "  {v}\n\n"
+    "Analyze ALL inputs (telemetry + visual) and provide your decision as JSON."
+)
+
+_REQUIRED_KEYS = frozenset(_DECISION_SCHEMA["required"])
+
+# Transient gateway failures worth retrying before falling back to safety.
+LLM_MAX_ATTEMPTS = 3
+_RETRY_BASE_DELAY_S = 0.25
+
+
+def _transient_llm_errors() -> tuple[type[Exception], ...]:
+    """Exception types worth retrying; SDK errors only once the SDK is loaded.
+
+    ``httpx.HTTPStatusError`` is only transient for 429s and 5xxs; see
+    :func:`_is_transient`.
+    """
+    openai = sys.modules.get("openai")
+    if openai is None:
+        return (httpx.TransportError, httpx.HTTPStatusError)
+    return (
+        httpx.TransportError,
+        httpx.HTTPStatusError,
+        openai.APIConnectionError,  # includes APITimeoutError
+        openai.RateLimitError,
+        openai.InternalServerError,
+    )
+
+
+def _is_transient(exc: Exception) -> bool:
+    """Return ``False`` for HTTP status errors a retry cannot fix (4xx but 429)."""
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return True
+
+
+class _ModelUnavailable(RuntimeError):
+    """The Blaxel SDK cannot resolve the model endpoint; use the direct client."""
+
+
 # ---------------------------------------------------------------------------
 # Safety fallback — returned when the LLM call or JSON parsing fails
 # ---------------------------------------------------------------------------
@@ -115,63 +216,319 @@ SAFETY_FALLBACK: dict = {
 }
 
 
+def is_safety_fallback(decision: dict) -> bool:
+    """Return ``True`` if *decision* is the ``SAFETY_FALLBACK`` hold, not a model answer."""
+    return decision.get("reasoning") == SAFETY_FALLBACK["reasoning"]
+
+
+# ---------------------------------------------------------------------------
+# Rule-based fast path — SYSTEM_PROMPT rules 1–2 are pure thresholds, so
+# clear-cut telemetry with no optical input never needs an LLM round trip.
+# ---------------------------------------------------------------------------
+NO_VISUAL_DATA = "No visual data."
+FAST_PATH_FIRE_ABOVE: float = 0.9
+FAST_PATH_HOLD_BELOW: float = 0.5
+
+
+def _rule_based_decision(
+    probability: object,
+    previous_rejection_reason: str | None,
+    visual_description: str,
+) -> dict | None:
+    """Return a local decision for unambiguous telemetry, else ``None``.
+
+    The LLM is still consulted for the 0.5–0.9 grey zone, whenever optical
+    data must be weighed, and on Shield-driven retries (which must diverge
+    from the rejected plan).
+    """
+    if previous_rejection_reason or visual_description != NO_VISUAL_DATA:
+        return None
+    if isinstance(probability, bool) or not isinstance(probability, (int, float)):
+        return None
+
+    if probability > FAST_PATH_FIRE_ABOVE:
+        return {
+            "action": "FIRE_THRUSTERS",
+            "reasoning": (
+                f"Collision probability {probability:.2f} far exceeds the 0.7 "
+                f"threshold, so a prograde avoidance burn is mandatory."
+            ),
+            "confidence_score": round(float(probability), 2),
+            "recommended_thrust_direction": "PROGRADE",
+        }
+    if probability < FAST_PATH_HOLD_BELOW:
+        return {
+            "action": "HOLD_POSITION",
+            "reasoning": (
+                f"Collision probability {probability:.2f} is well below the 0.7 "
+                f"threshold, so holding position is safe."
+            ),
+            "confidence_score": round(1.0 - float(probability), 2),
+            "recommended_thrust_direction": "NONE",
+        }
+    return None
+
+
+# ---------------------------------------------------------------------------
+# Decision cache — nearby telemetry yields the same decision, so repeats
+# within a demo burst are answered without another LLM call.  Entries expire
+# after DECISION_CACHE_TTL_S so a long-lived process keeps re-consulting the
+# model as conditions drift.
+# ---------------------------------------------------------------------------
+DECISION_CACHE_SIZE: int = 512
+DECISION_CACHE_TTL_S: float = float(os.getenv("DECISION_CACHE_TTL_S", "300"))
+
+# key -> (monotonic insert time, raw JSON decision)
+_decision_cache: OrderedDict[tuple, tuple[float, str]] = OrderedDict()
+_decision_cache_lock = threading.Lock()
+
+
+def _decision_cache_key(
+    altitude: object,
+    probability: object,
+    status: object,
+    visual_description: str,
+) -> tuple | None:
+    """Bucket telemetry into a cache key, or ``None`` if it is not numeric.
+
+    Altitude is bucketed to 10 km and probability to 0.05; the side of the
+    0.7 action threshold is part of the key so a bucket can never straddle
+    FIRE_THRUSTERS and HOLD_POSITION.
+    """
+    numeric = (int, float)
+    if (
+        isinstance(altitude, bool) or not isinstance(altitude, numeric)
+        or isinstance(probability, bool) or not isinstance(probability, numeric)
+    ):
+        return None
+    visual_key = hashlib.blake2b(
+        visual_description.encode("utf-8"), digest_size=8,
+    ).hexdigest()
+    return (
+        int(altitude // 10),
+        int(probability * 20),
+        probability > 0.7,
+        str(status),
+        visual_key,
+    )
+
+
+def _decision_cache_get(key: tuple) -> dict | None:
+    with _decision_cache_lock:
+        entry = _decision_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, raw = entry
+        if time.monotonic() - stored_at > DECISION_CACHE_TTL_S:
+            del _decision_cache[key]
+            return None
+        _decision_cache.move_to_end(key)
+    # Parse a fresh copy so callers may mutate the decision freely
+    return orjson.loads(raw)
+
+
+def _decision_cache_put(key: tuple, raw_text: str) -> None:
+    with _decision_cache_lock:
+        _decision_cache[key] = (time.monotonic(), raw_text)
+        _decision_cache.move_to_end(key)
+        while len(_decision_cache) > DECISION_CACHE_SIZE:
+            _decision_cache.popitem(last=False)
+
+
 # ---------------------------------------------------------------------------
 # Internal: call LLM via the best available path
 # ---------------------------------------------------------------------------
 
-async def _call_llm_async(messages: list[dict]) -> str:
-    """Call the Blaxel-hosted LLM asynchronously via the SDK."""
-    if _bl_model is None:
-        raise RuntimeError("BLModel not available")
+# Shared async runtime: one background event loop owns one pooled
+# httpx.AsyncClient, so TCP/TLS connections survive across decisions
+# instead of being torn down after every call.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_lock = threading.Lock()
+_async_http: httpx.AsyncClient | None = None
+
+
+def _get_loop() -> asyncio.AbstractEventLoop:
+    """Return the Commander's background event loop, starting it on first use."""
+    global _loop
+    with _loop_lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever,
+                name="commander-loop",
+                daemon=True,
+            ).start()
+    return _loop
+
+
+def _get_async_http() -> httpx.AsyncClient:
+    """Return the pooled async HTTP client (loop thread only)."""
+    global _async_http
+    if _async_http is None:
+        _async_http = httpx.AsyncClient(
+            headers={
+                "Authorization": f"Bearer {BLAXEL_API_KEY}",
+                "X-Blaxel-Authorization": f"Bearer {BLAXEL_API_KEY}",
+                "X-Blaxel-Workspace": BLAXEL_WORKSPACE,
+            },
+            timeout=30.0,
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=50,
+            ),
+            http2=True,
+        )
+    return _async_http
+
+
+def _close_async_runtime() -> None:
+    """Close pooled connections and stop the background loop at exit."""
+    if _loop is None:
+        return
+    try:
+        if _async_http is not None:
+            asyncio.run_coroutine_threadsafe(
+                _async_http.aclose(), _loop,
+            ).result(timeout=5)
+    except Exception:  # noqa: BLE001
+        pass
+    _loop.call_soon_threadsafe(_loop.stop)
+
+
+atexit.register(_close_async_runtime)
+
 
-    url, _type, model = await _bl_model.get_parameters()
+async def _call_llm_async(messages: list[dict], params: dict = _COMPLETION_PARAMS) -> str:
+    """Call the Blaxel-hosted LLM asynchronously via the SDK-resolved URL.
 
-    # Build an async OpenAI client pointing at the resolved URL
-    async_http = httpx.AsyncClient(
-        headers={
-            "X-Blaxel-Authorization": f"Bearer {BLAXEL_API_KEY}",
-            "X-Blaxel-Workspace": BLAXEL_WORKSPACE,
+    Posts straight to ``/chat/completions`` on the pooled client; the
+    request shape is fixed, so the OpenAI SDK's per-call request building
+    and response model parsing add nothing on this hot path.
+    """
+    if _bl_model is None:
+        raise _ModelUnavailable("BLModel not available")
+    try:
+        url, _type, model = await _bl_model.get_parameters()
+    except Exception as exc:  # noqa: BLE001
+        raise _ModelUnavailable(f"BLModel endpoint resolution failed: {exc}") from exc
+
+    response = await _get_async_http().post(
+        f"{url}/v1/chat/completions",
+        json={
+            "model": model or _DEFAULT_LLM_MODEL,
+            "messages": messages,
+            **params,
         },
-        timeout=30.0,
     )
-    from openai import AsyncOpenAI
-    async_client = AsyncOpenAI(
-        api_key=BLAXEL_API_KEY,
-        base_url=f"{url}/v1",
-        http_client=async_http,
-    )
-    try:
-        response = await async_client.chat.completions.create(
-            model=model or "gpt-4o-mini",
-            messages=messages,
-            temperature=0.2,
-            max_tokens=256,
-        )
-        return response.choices[0].message.content
-    finally:
-        await async_http.aclose()
+    response.raise_for_status()
+    return response.json()["choices"][0]["message"]["content"]
 
 
-def _call_llm_sync(messages: list[dict]) -> str:
+def _call_llm_sync(messages: list[dict], params: dict = _COMPLETION_PARAMS) -> str:
     """Call the Blaxel-hosted LLM synchronously via the direct OpenAI client."""
-    response = _openai_client.chat.completions.create(
-        model="gpt-4o-mini",
+    response = _get_openai_client().chat.completions.create(
+        model=_DEFAULT_LLM_MODEL,
         messages=messages,
-        temperature=0.2,
-        max_tokens=256,
         timeout=30,
+        extra_body=params,
     )
     return response.choices[0].message.content
 
 
+def _build_messages(
+    risk_data: dict,
+    previous_rejection_reason: str | None,
+    visual_description: str,
+) -> list[dict]:
+    """Assemble the chat messages for one decision request."""
+    # -- Build the user prompt with telemetry + visual fields ---------------
+    user_prompt = _USER_TEMPLATE.format(
+        alt=risk_data.get("altitude_km", "N/A"),
+        p=risk_data.get("collision_probability", "N/A"),
+        s=risk_data.get("status", "N/A"),
+        v=visual_description,
+    )
+
+    messages = [_SYSTEM_MESSAGE, {"role": "user", "content": user_prompt}]
+
+    # -- Feedback loop: rejection context goes in its own trailing message so
+    #    the system + telemetry prefix stays identical across retries -------
+    if previous_rejection_reason:
+        messages.append({
+            "role": "user",
+            "content": (
+                f"CRITICAL UPDATE: Your previous plan was BLOCKED by the "
+                f"security system because: '{previous_rejection_reason}'. "
+                f"You must generate a NEW plan that avoids this specific violation."
+            ),
+        })
+    return messages
+
+
+async def _complete_on_loop(messages: list[dict], params: dict) -> str:
+    """Prefer the async SDK path; fall back to the sync direct client.
+
+    Only a missing or unresolvable BLModel falls back.  Errors from the
+    gateway itself propagate so :func:`_complete_with_retry` can back off.
+    """
+    try:
+        return await _call_llm_async(messages, params)
+    except _ModelUnavailable:
+        return await asyncio.to_thread(_call_llm_sync, messages, params)
+
+
+async def _complete_with_retry(
+    messages: list[dict], params: dict = _COMPLETION_PARAMS,
+) -> str:
+    """Run :func:`_complete`, retrying transient failures with backoff.
+
+    Timeouts, connection drops, 429s and 5xxs are retried up to
+    ``LLM_MAX_ATTEMPTS`` times with exponential backoff plus jitter; any
+    other error (or the last transient one) propagates to the caller.
+    """
+    for attempt in range(LLM_MAX_ATTEMPTS - 1):
+        try:
+            return await _complete(messages, params)
+        except _transient_llm_errors() as exc:
+            if not _is_transient(exc):
+                raise
+            delay = (2 ** attempt) * _RETRY_BASE_DELAY_S + random.random() * 0.1
+            logger.warning(
+                "Transient LLM error (%s); retry %d/%d in %.2f s",
+                type(exc).__name__, attempt + 1, LLM_MAX_ATTEMPTS - 1, delay,
+            )
+            count("llm_retries")
+            await asyncio.sleep(delay)
+    return await _complete(messages, params)
+
+
+async def _complete(messages: list[dict], params: dict) -> str:
+    """Run the completion on the Commander loop, which owns the pooled client."""
+    loop = _get_loop()
+    if asyncio.get_running_loop() is loop:
+        return await _complete_on_loop(messages, params)
+    return await asyncio.wrap_future(
+        asyncio.run_coroutine_threadsafe(_complete_on_loop(messages, params), loop),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Core decision function
 # ---------------------------------------------------------------------------
 
-def analyze_situation(
+def _record_decision(decision: dict, probability: object, *, fast_path: bool) -> None:
+    """Store which path decided, so /insights can report the fast-path split."""
+    record_event("act", {
+        "fast_path": fast_path,
+        "action": decision.get("action"),
+        "risk_probability": probability,
+    })
+
+
+async def analyze_situation_async(
     risk_data: dict,
     previous_rejection_reason: str | None = None,
-    visual_description: str = "No visual data.",
+    visual_description: str = NO_VISUAL_DATA,
 ) -> dict:
     """Feed telemetry + visual data to the LLM and return a structured decision.
 
@@ -194,78 +551,70 @@ def analyze_situation(
         A decision object matching the JSON schema defined in
         ``SYSTEM_PROMPT``, or ``SAFETY_FALLBACK`` on error.
     """
-    # -- Build the user prompt with telemetry + visual fields ---------------
-    altitude = risk_data.get("altitude_km", "N/A")
     probability = risk_data.get("collision_probability", "N/A")
     status = risk_data.get("status", "N/A")
 
-    user_prompt = (
-        f"Satellite telemetry update:\n"
-        f"  • Altitude:              {altitude} km\n"
-        f"  • Collision Probability: {probability}\n"
-        f"  • Current Status:        {status}\n\n"
-        f"Optical sensor analysis:\n"
-        f"  {visual_description}\n\n"
-        f"Analyze ALL inputs (telemetry + visual) and provide your decision as JSON."
+    # -- Fast path: deterministic thresholds, no LLM round trip -------------
+    local_decision = _rule_based_decision(
+        probability, previous_rejection_reason, visual_description,
     )
-
-    # -- Feedback loop: inject rejection context so the model self-corrects -
-    if previous_rejection_reason:
-        user_prompt += (
-            f"\n\nCRITICAL UPDATE: Your previous plan was BLOCKED by the "
-            f"security system because: '{previous_rejection_reason}'. "
-            f"You must generate a NEW plan that avoids this specific violation."
+    if local_decision is not None:
+        logger.info(
+            "Decision: %s (confidence=%.2f) via rule-based fast path",
+            local_decision["action"],
+            local_decision["confidence_score"],
         )
-
-    messages = [
-        {"role": "system", "content": SYSTEM_PROMPT},
-        {"role": "user", "content": user_prompt},
-    ]
+        _record_decision(local_decision, probability, fast_path=True)
+        return local_decision
+
+    # -- Cache: retries after a Shield rejection must diverge, never cached --
+    cache_key = None
+    if not previous_rejection_reason:
+        cache_key = _decision_cache_key(
+            risk_data.get("altitude_km"), probability, status, visual_description,
+        )
+        if cache_key is not None:
+            cached = _decision_cache_get(cache_key)
+            count("decision_cache_lookups")
+            if cached is not None:
+                count("decision_cache_hits")
+                logger.info("Decision: %s via decision cache", cached["action"])
+                _record_decision(cached, probability, fast_path=False)
+                return cached
+
+    messages = _build_messages(
+        risk_data, previous_rejection_reason, visual_description,
+    )
 
     start = time.perf_counter()
 
     try:
-        # Prefer async SDK path; fall back to sync direct client
-        try:
-            raw_text = asyncio.get_event_loop().run_until_complete(
-                _call_llm_async(messages),
-            )
-        except (RuntimeError, Exception):
-            # Either no event loop, BLModel unavailable, or SDK error
-            raw_text = _call_llm_sync(messages)
-
+        raw_text = await _complete_with_retry(messages)
         elapsed = round((time.perf_counter() - start) * 1000)
-        raw_text = raw_text.strip()
 
-        # -- Strip Markdown fences if the model wraps its output -------------
-        raw_text = re.sub(r"^```(?:json)?\s*", "", raw_text)
-        raw_text = re.sub(r"\s*```$", "", raw_text)
-        raw_text = raw_text.strip()
-
-        decision = json.loads(raw_text)
+        # Structured output guarantees a bare object — no Markdown fences
+        decision = orjson.loads(raw_text)
 
         # -- Minimal schema validation --------------------------------------
-        required_keys = {
-            "action",
-            "reasoning",
-            "confidence_score",
-            "recommended_thrust_direction",
-        }
-        if not required_keys.issubset(decision.keys()):
+        if not _REQUIRED_KEYS.issubset(decision.keys()):
             logger.warning(
-                "Missing keys in response: %s", required_keys - decision.keys(),
+                "Missing keys in response: %s", _REQUIRED_KEYS - decision.keys(),
             )
             return SAFETY_FALLBACK.copy()
 
+        if cache_key is not None:
+            _decision_cache_put(cache_key, raw_text)
+
         logger.info(
             "Decision: %s (confidence=%.2f) in %d ms",
             decision["action"],
             decision.get("confidence_score", 0),
             elapsed,
         )
+        _record_decision(decision, probability, fast_path=False)
         return decision
 
-    except (json.JSONDecodeError, ValueError) as exc:
+    except (orjson.JSONDecodeError, ValueError) as exc:
         logger.error("JSON parse error: %s", exc)
         return SAFETY_FALLBACK.copy()
     except Exception as exc:  # noqa: BLE001
@@ -273,6 +622,89 @@ def analyze_situation(
         return SAFETY_FALLBACK.copy()
 
 
+def analyze_situation(
+    risk_data: dict,
+    previous_rejection_reason: str | None = None,
+    visual_description: str = NO_VISUAL_DATA,
+) -> dict:
+    """Synchronous wrapper around :func:`analyze_situation_async`.
+
+    Runs the decision on the Commander's shared event loop and blocks until
+    it completes.  Must not be called from that loop itself.
+    """
+    return asyncio.run_coroutine_threadsafe(
+        analyze_situation_async(
+            risk_data, previous_rejection_reason, visual_description,
+        ),
+        _get_loop(),
+    ).result()
+
+
+# Extra candidates are drawn at temperatures spread up to this value, so a
+# Shield rejection of the default plan is likely to find a different one.
+SAMPLE_TEMPERATURE_MAX: float = 0.8
+
+
+async def _sample_decision(messages: list[dict], temperature: float) -> dict:
+    """One uncached LLM decision at *temperature* (``SAFETY_FALLBACK`` on error)."""
+    try:
+        raw_text = await _complete_with_retry(
+            messages, {**_COMPLETION_PARAMS, "temperature": temperature},
+        )
+        decision = orjson.loads(raw_text)
+        if _REQUIRED_KEYS.issubset(decision.keys()):
+            return decision
+        logger.warning("Missing keys in sampled response")
+    except Exception as exc:  # noqa: BLE001
+        logger.error("Sampled decision failed: %s", exc)
+    return SAFETY_FALLBACK.copy()
+
+
+async def sample_decisions_async(
+    risk_data: dict,
+    visual_description: str = NO_VISUAL_DATA,
+    samples: int = 2,
+) -> list[dict]:
+    """Return up to *samples* distinct candidate decisions, concurrently.
+
+    The first candidate is the regular :func:`analyze_situation_async`
+    answer (fast path and decision cache apply).  The rest bypass the cache
+    and are drawn at increasing temperatures up to ``SAMPLE_TEMPERATURE_MAX``
+    so they are not copies of the first.  Telemetry the rule-based fast
+    path answers yields a single candidate — sampling cannot change it.
+    """
+    if samples <= 1 or _rule_based_decision(
+        risk_data.get("collision_probability", "N/A"), None, visual_description,
+    ) is not None:
+        return [await analyze_situation_async(risk_data, None, visual_description)]
+
+    base = _COMPLETION_PARAMS["temperature"]
+    step = (SAMPLE_TEMPERATURE_MAX - base) / (samples - 1)
+    messages = _build_messages(risk_data, None, visual_description)
+    return list(await asyncio.gather(
+        analyze_situation_async(risk_data, None, visual_description),
+        *(_sample_decision(messages, base + step * i) for i in range(1, samples)),
+    ))
+
+
+async def analyze_batch(
+    risk_list: list[dict],
+    concurrency: int = 10,
+) -> list[dict]:
+    """Decide for many conjunction reports concurrently (fleet-wide scans).
+
+    At most *concurrency* LLM calls are in flight at once; results are
+    returned in the same order as *risk_list*.
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _bounded(risk_data: dict) -> dict:
+        async with semaphore:
+            return await analyze_situation_async(risk_data)
+
+    return list(await asyncio.gather(*(_bounded(r) for r in risk_list)))
+
+
 # ---------------------------------------------------------------------------
 # Local test harness
 # ---------------------------------------------------------------------------
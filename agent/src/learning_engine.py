@@ -11,17 +11,76 @@ Stores runtime events as JSON Lines and produces:
 
 from __future__ import annotations
 
-import json
+import atexit
+import logging
+import os
+import queue
 import threading
+import time
 from collections import Counter, defaultdict
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
-_LOCK = threading.Lock()
+import numpy as np
+import orjson
+
+logger = logging.getLogger("vyuha.learning")
+
 _DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 _EVENTS_FILE = _DATA_DIR / "agent_events.jsonl"
+# Once the live file passes _MAX_EVENTS_BYTES it is moved to _ROTATED_FILE
+# (replacing any previous one) and a fresh file is started. The size is
+# checked every _ROTATE_CHECK_EVERY writes.
+_ROTATED_FILE = _EVENTS_FILE.with_suffix(".jsonl.1")
+_MAX_EVENTS_BYTES = 32 << 20
+_ROTATE_CHECK_EVERY = 100
 _MAX_RECENT_EVENTS = 80
+# Cold-start rebuilds over at least this many events are aggregated
+# column-wise with NumPy.
+_VECTORISE_MIN_EVENTS = 1000
+
+# Events are appended through a single O_APPEND descriptor. record_event()
+# only enqueues the event and its encoded line; one writer thread drains
+# whatever has queued up, folds it into the insight aggregate and appends it
+# with a single write() call, which the kernel applies atomically at
+# end-of-file, so readers never see a torn line.
+_events_fd: int | None = None
+_OPEN_LOCK = threading.Lock()
+_writes_since_check = 0
+_MAX_WRITE_BATCH = 256
+# Pending events beyond this are dropped oldest-first rather than letting a
+# stalled disk grow memory without bound (they are neither stored nor counted,
+# matching what a rebuild from disk would see).
+_MAX_PENDING_WRITES = 10_000
+_write_queue: queue.Queue[tuple[dict[str, Any], bytes] | None] = queue.Queue(
+    maxsize=_MAX_PENDING_WRITES,
+)
+_writer_thread: threading.Thread | None = None
+
+# Running insight aggregate, folded forward by the writer thread. None until
+# the first reader or the writer rebuilds it from the store — always off the
+# request path, since a rebuild parses the whole store.
+_AGG: dict[str, Any] | None = None
+_AGG_LOCK = threading.Lock()
+
+# In-process Commander telemetry (decision-cache lookups, LLM retries). Too
+# frequent to be worth a disk write each, so it is counted in memory only and
+# resets with the process.
+_COUNTERS: Counter = Counter()
+_COUNTERS_LOCK = threading.Lock()
+# Bumped on every count(), so cached insights notice counter-only changes
+_counters_generation = 0
+
+# Last get_insights() result keyed on the store's (st_mtime_ns, st_size) and
+# the counters generation; size is part of the key because mtime granularity
+# can be coarser than the interval between two appends.  Within _INSIGHTS_TTL_S of computing it the
+# result is returned without even a stat() (dashboards poll every second).
+_INSIGHTS_TTL_S = float(os.getenv("INSIGHTS_TTL_S", "2"))
+_INSIGHTS_CACHE: tuple[tuple[int, int, int], float, dict[str, Any]] | None = None
+
+# Tail reads walk backwards from EOF in chunks of this size
+_TAIL_CHUNK_BYTES = 1 << 16
 
 
 def _now_iso() -> str:
@@ -34,30 +93,199 @@ def _ensure_store() -> None:
         _EVENTS_FILE.touch()
 
 
+def _open_events_file() -> int:
+    return os.open(_EVENTS_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+
+
+def _events_descriptor() -> int:
+    """Return the shared O_APPEND descriptor, opening it on first use."""
+    global _events_fd
+    fd = _events_fd
+    if fd is None:
+        with _OPEN_LOCK:
+            if _events_fd is None:
+                _ensure_store()
+                _events_fd = _open_events_file()
+            fd = _events_fd
+    return fd
+
+
+def _maybe_rotate(fd: int) -> None:
+    """Rotate the live file once it exceeds ``_MAX_EVENTS_BYTES``."""
+    with _OPEN_LOCK:
+        if fd != _events_fd or os.fstat(fd).st_size <= _MAX_EVENTS_BYTES:
+            return
+        os.replace(_EVENTS_FILE, _ROTATED_FILE)
+        fresh = _open_events_file()
+        # Re-point the shared descriptor number at the new file in one step,
+        # so writers that already hold it never write to a recycled fd.
+        os.dup2(fresh, fd)
+        os.close(fresh)
+
+
+def _append_lines(lines: list[bytes]) -> None:
+    global _writes_since_check
+    fd = _events_descriptor()
+    data = memoryview(b"".join(lines))
+    while data:
+        # A short write (signal, nearly full disk) leaves the rest pending
+        data = data[os.write(fd, data):]
+    _writes_since_check += len(lines)
+    if _writes_since_check >= _ROTATE_CHECK_EVERY:
+        _writes_since_check = 0
+        _maybe_rotate(fd)
+
+
+def _write_batch(batch: list[tuple[dict[str, Any], bytes]]) -> None:
+    """Fold *batch* into the aggregate, then append its lines to the store."""
+    global _AGG
+    with _AGG_LOCK:
+        try:
+            # Fold in before appending so a cold-start rebuild never
+            # counts the same event twice.
+            agg = _load_aggregate()
+            for event, _ in batch:
+                _accumulate(agg, event)
+            _append_lines([line for _, line in batch])
+        except Exception:
+            # The aggregate may now disagree with the store; rebuild it from
+            # disk on next use.
+            _AGG = None
+            raise
+
+
+def _drain_writes() -> None:
+    """Writer-thread loop: fold queued events, then append them in one write."""
+    while True:
+        item = _write_queue.get()
+        batch: list[tuple[dict[str, Any], bytes]] = []
+        while item is not None:
+            batch.append(item)
+            if len(batch) >= _MAX_WRITE_BATCH:
+                break
+            try:
+                item = _write_queue.get_nowait()
+            except queue.Empty:
+                break
+        if batch:
+            try:
+                _write_batch(batch)
+            except Exception:  # noqa: BLE001 — the writer must outlive one bad batch
+                logger.exception("Event writer dropped a batch of %d events", len(batch))
+        if item is None:
+            return
+
+
+def _start_writer() -> None:
+    global _writer_thread
+    if _writer_thread is None:
+        with _OPEN_LOCK:
+            if _writer_thread is None:
+                _writer_thread = threading.Thread(
+                    target=_drain_writes, name="events-writer", daemon=True,
+                )
+                _writer_thread.start()
+
+
+def _close_events_descriptor() -> None:
+    global _events_fd
+    if _writer_thread is not None:
+        # Sentinel: the writer flushes everything queued before it and exits
+        _enqueue(None)
+        _writer_thread.join(timeout=5)
+    with _OPEN_LOCK:
+        if _events_fd is not None:
+            os.close(_events_fd)
+            _events_fd = None
+
+
+atexit.register(_close_events_descriptor)
+
+
+def _enqueue(item: tuple[dict[str, Any], bytes] | None) -> None:
+    while True:
+        try:
+            _write_queue.put_nowait(item)
+            return
+        except queue.Full:
+            try:
+                _write_queue.get_nowait()
+            except queue.Empty:
+                pass
+
+
+def _compact_payload(event_type: str, payload: dict[str, Any]) -> dict[str, Any]:
+    """Drop bulky detail that only matters for failed runs before storage.
+
+    Executed ``act`` events keep every attempt's validation outcome (all that
+    the insights read) but only the final attempt's full command.
+    """
+    attempts_log = payload.get("attempts_log")
+    if event_type != "act" or payload.get("status") != "EXECUTED" or not attempts_log:
+        return payload
+    compact = [
+        {"attempt": a.get("attempt"), "validation": a.get("validation", {})}
+        for a in attempts_log[:-1]
+    ]
+    compact.append(attempts_log[-1])
+    return {**payload, "attempts_log": compact}
+
+
+def count(metric: str, n: int = 1) -> None:
+    """Increment an in-memory runtime counter reported by :func:`get_insights`."""
+    global _counters_generation
+    with _COUNTERS_LOCK:
+        _COUNTERS[metric] += n
+        _counters_generation += 1
+
+
 def record_event(event_type: str, payload: dict[str, Any]) -> None:
-    """Persist one event to JSONL storage."""
-    _ensure_store()
+    """Record one event; aggregation and the JSONL append happen off-thread."""
     event = {
         "timestamp": _now_iso(),
         "event_type": event_type,
-        "payload": payload,
+        "payload": _compact_payload(event_type, payload),
     }
-    line = json.dumps(event, separators=(",", ":"))
-    with _LOCK:
-        with _EVENTS_FILE.open("a", encoding="utf-8") as f:
-            f.write(line + "\n")
+    line = orjson.dumps(
+        event, option=orjson.OPT_APPEND_NEWLINE | orjson.OPT_NON_STR_KEYS,
+    )
+    _start_writer()
+    _enqueue((event, line))
+
+
+def _tail_lines(path: Path, limit: int) -> list[bytes]:
+    """Return the last *limit* lines of *path* (all if ``limit <= 0``).
+
+    Reads backwards from EOF in fixed-size chunks, so the cost scales with
+    *limit* rather than with the size of the whole store.
+    """
+    with path.open("rb") as f:
+        f.seek(0, os.SEEK_END)
+        pos = f.tell()
+        buf = b""
+        while pos > 0 and (limit <= 0 or buf.count(b"\n") <= limit):
+            step = min(_TAIL_CHUNK_BYTES, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    lines = buf.splitlines()
+    if pos > 0:
+        # The first line was cut mid-way by the chunk boundary
+        lines = lines[1:]
+    return lines[-limit:] if limit > 0 else lines
 
 
 def _load_events(limit: int = 500) -> list[dict[str, Any]]:
     _ensure_store()
-    with _LOCK:
-        lines = _EVENTS_FILE.read_text(encoding="utf-8").splitlines()
-    selected = lines[-limit:] if limit > 0 else lines
+    selected = _tail_lines(_EVENTS_FILE, limit)
+    if (limit <= 0 or len(selected) < limit) and _ROTATED_FILE.exists():
+        older = _tail_lines(_ROTATED_FILE, limit - len(selected) if limit > 0 else 0)
+        selected = older + selected
     events: list[dict[str, Any]] = []
     for line in selected:
         try:
-            events.append(json.loads(line))
-        except json.JSONDecodeError:
+            events.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
             continue
     return events
 
@@ -97,10 +325,193 @@ def _build_recommendations(
     return recs
 
 
+def _tally_attempts(
+    attempts_log: list[dict[str, Any]],
+    tag_counter: Counter,
+    source_counter: Counter,
+) -> int:
+    """Count validation sources / violation tags; return blocked attempts."""
+    blocked = 0
+    for attempt in attempts_log:
+        validation = attempt.get("validation", {})
+        source = validation.get("source", "unknown")
+        source_counter.update([source])
+        tags = validation.get("violation_tags", [])
+        if validation.get("valid") is False:
+            blocked += 1
+            tag_counter.update(tags if tags else ["UNKNOWN"])
+    return blocked
+
+
+def _empty_aggregate() -> dict[str, Any]:
+    return {
+        "total_events": 0,
+        "scan_count": 0,
+        "act_count": 0,
+        "successful_exec": 0,
+        "blocked_attempts": 0,
+        "fast_path_decisions": 0,
+        "llm_decisions": 0,
+        "scan_latency_sum": 0.0,
+        "act_latency_sum": 0.0,
+        "tag_counter": Counter(),
+        "source_counter": Counter(),
+        "scenario_counter": Counter(),
+        "endpoint_errors": defaultdict(int),
+    }
+
+
+def _scenario_label(payload: dict[str, Any]) -> str:
+    """Scenario key for a scan payload; missing or null modes are ``UNKNOWN``."""
+    mode = payload.get("scenario_mode")
+    return "UNKNOWN" if mode is None else str(mode)
+
+
+def _accumulate(agg: dict[str, Any], event: dict[str, Any]) -> None:
+    """Fold one event into a running aggregate in place."""
+    etype = event.get("event_type", "")
+    payload = event.get("payload", {})
+
+    if etype == "scan":
+        agg["total_events"] += 1
+        agg["scan_count"] += 1
+        agg["scan_latency_sum"] += float(payload.get("latency_ms", 0))
+        agg["scenario_counter"].update([_scenario_label(payload)])
+        if payload.get("status") == "ERROR":
+            agg["endpoint_errors"]["scan"] += 1
+
+    elif etype == "act" and "fast_path" in payload:
+        # Commander decision record, not an /act request
+        agg["fast_path_decisions" if payload["fast_path"] else "llm_decisions"] += 1
+
+    elif etype == "act":
+        agg["total_events"] += 1
+        agg["act_count"] += 1
+        agg["act_latency_sum"] += float(payload.get("latency_ms", 0))
+        if payload.get("status") == "EXECUTED":
+            agg["successful_exec"] += 1
+        if payload.get("status", "").startswith("MANUAL_"):
+            agg["endpoint_errors"]["act"] += 1
+        agg["blocked_attempts"] += _tally_attempts(
+            payload.get("attempts_log", []),
+            agg["tag_counter"],
+            agg["source_counter"],
+        )
+
+
+def _aggregate_python(events: list[dict[str, Any]]) -> dict[str, Any]:
+    agg = _empty_aggregate()
+    for event in events:
+        _accumulate(agg, event)
+    return agg
+
+
+def _aggregate_numpy(events: list[dict[str, Any]]) -> dict[str, Any]:
+    """Column-wise variant of :func:`_aggregate_python` for large windows."""
+    payloads = [event.get("payload", {}) for event in events]
+    types = np.array([event.get("event_type", "") for event in events])
+    latencies = np.array(
+        [float(p.get("latency_ms", 0)) for p in payloads], dtype=np.float64,
+    )
+    statuses = np.array([p.get("status") or "" for p in payloads])
+    scan_mask = types == "scan"
+    decision_mask = (types == "act") & np.array(["fast_path" in p for p in payloads])
+    act_mask = (types == "act") & ~decision_mask
+    fast_path = np.array([bool(p.get("fast_path")) for p in payloads])
+
+    scenarios = np.array([_scenario_label(payloads[i]) for i in np.flatnonzero(scan_mask)])
+    scenario_counter: Counter = Counter()
+    if scenarios.size:
+        labels, counts = np.unique(scenarios, return_counts=True)
+        scenario_counter.update(dict(zip(labels.tolist(), counts.tolist())))
+
+    endpoint_errors: defaultdict[str, int] = defaultdict(int)
+    scan_errors = int((statuses[scan_mask] == "ERROR").sum())
+    act_errors = int(np.char.startswith(statuses[act_mask], "MANUAL_").sum())
+    if scan_errors:
+        endpoint_errors["scan"] = scan_errors
+    if act_errors:
+        endpoint_errors["act"] = act_errors
+
+    tag_counter: Counter = Counter()
+    source_counter: Counter = Counter()
+    blocked_attempts = 0
+    for i in np.flatnonzero(act_mask):
+        blocked_attempts += _tally_attempts(
+            payloads[i].get("attempts_log", []), tag_counter, source_counter,
+        )
+
+    return {
+        "total_events": int(scan_mask.sum() + act_mask.sum()),
+        "scan_count": int(scan_mask.sum()),
+        "act_count": int(act_mask.sum()),
+        "successful_exec": int((statuses[act_mask] == "EXECUTED").sum()),
+        "blocked_attempts": blocked_attempts,
+        "fast_path_decisions": int((decision_mask & fast_path).sum()),
+        "llm_decisions": int((decision_mask & ~fast_path).sum()),
+        "scan_latency_sum": float(latencies[scan_mask].sum()),
+        "act_latency_sum": float(latencies[act_mask].sum()),
+        "tag_counter": tag_counter,
+        "source_counter": source_counter,
+        "scenario_counter": scenario_counter,
+        "endpoint_errors": endpoint_errors,
+    }
+
+
+def _store_version() -> tuple[int, int]:
+    _ensure_store()
+    st = _EVENTS_FILE.stat()
+    return st.st_mtime_ns, st.st_size
+
+
 def get_insights() -> dict[str, Any]:
-    """Return aggregated learning metrics + recent events."""
-    events = _load_events(limit=800)
-    if not events:
+    """Return aggregated learning metrics + recent events.
+
+    The result is reused for ``INSIGHTS_TTL_S`` seconds, and after that
+    until the event store changes on disk or a runtime counter moves.
+    """
+    global _INSIGHTS_CACHE
+    cached = _INSIGHTS_CACHE
+    now = time.monotonic()
+    if cached is not None and now - cached[1] < _INSIGHTS_TTL_S:
+        return cached[2]
+    version = (*_store_version(), _counters_generation)
+    if cached is not None and cached[0] == version:
+        _INSIGHTS_CACHE = (version, now, cached[2])
+        return cached[2]
+    result = _compute_insights()
+    _INSIGHTS_CACHE = (version, now, result)
+    return result
+
+
+def _load_aggregate() -> dict[str, Any]:
+    """Return the running aggregate, rebuilding it from disk on cold start.
+
+    Callers must hold ``_AGG_LOCK``.
+    """
+    global _AGG
+    if _AGG is None:
+        _ensure_store()
+        events = _load_events(limit=0)
+        if len(events) >= _VECTORISE_MIN_EVENTS:
+            _AGG = _aggregate_numpy(events)
+        else:
+            _AGG = _aggregate_python(events)
+    return _AGG
+
+
+def _snapshot_aggregate() -> dict[str, Any]:
+    with _AGG_LOCK:
+        agg = _load_aggregate()
+        return {
+            key: value.copy() if isinstance(value, (Counter, defaultdict)) else value
+            for key, value in agg.items()
+        }
+
+
+def _compute_insights() -> dict[str, Any]:
+    agg = _snapshot_aggregate()
+    if not agg["total_events"]:
         return {
             "summary": {
                 "total_events": 0,
@@ -117,48 +528,27 @@ def get_insights() -> dict[str, Any]:
             "recent_events": [],
         }
 
-    scan_count = 0
-    act_count = 0
-    successful_exec = 0
-    blocked_attempts = 0
-    scan_latencies: list[float] = []
-    act_latencies: list[float] = []
-    tag_counter: Counter = Counter()
-    source_counter: Counter = Counter()
-    scenario_counter: Counter = Counter()
-    endpoint_errors: defaultdict[str, int] = defaultdict(int)
+    scan_count = agg["scan_count"]
+    act_count = agg["act_count"]
+    successful_exec = agg["successful_exec"]
+    blocked_attempts = agg["blocked_attempts"]
+    scan_latency_sum = agg["scan_latency_sum"]
+    act_latency_sum = agg["act_latency_sum"]
+    tag_counter = agg["tag_counter"]
+    source_counter = agg["source_counter"]
+    scenario_counter = agg["scenario_counter"]
+    endpoint_errors = agg["endpoint_errors"]
 
-    for event in events:
-        etype = event.get("event_type", "")
-        payload = event.get("payload", {})
-
-        if etype == "scan":
-            scan_count += 1
-            scan_latencies.append(float(payload.get("latency_ms", 0)))
-            scenario_counter.update([payload.get("scenario_mode", "UNKNOWN")])
-            if payload.get("status") == "ERROR":
-                endpoint_errors["scan"] += 1
-
-        elif etype == "act":
-            act_count += 1
-            act_latencies.append(float(payload.get("latency_ms", 0)))
-            if payload.get("status") == "EXECUTED":
-                successful_exec += 1
-            if payload.get("status", "").startswith("MANUAL_"):
-                endpoint_errors["act"] += 1
-
-            for attempt in payload.get("attempts_log", []):
-                validation = attempt.get("validation", {})
-                source = validation.get("source", "unknown")
-                source_counter.update([source])
-                tags = validation.get("violation_tags", [])
-                if validation.get("valid") is False:
-                    blocked_attempts += 1
-                    tag_counter.update(tags if tags else ["UNKNOWN"])
-
-    avg_scan_ms = round(sum(scan_latencies) / len(scan_latencies), 2) if scan_latencies else 0.0
-    avg_act_ms = round(sum(act_latencies) / len(act_latencies), 2) if act_latencies else 0.0
+    avg_scan_ms = round(scan_latency_sum / scan_count, 2) if scan_count else 0.0
+    avg_act_ms = round(act_latency_sum / act_count, 2) if act_count else 0.0
     success_rate = round((successful_exec / act_count) * 100, 2) if act_count else 0.0
+    with _COUNTERS_LOCK:
+        counters = dict(_COUNTERS)
+    cache_lookups = counters.get("decision_cache_lookups", 0)
+    cache_hit_rate = (
+        round((counters.get("decision_cache_hits", 0) / cache_lookups) * 100, 2)
+        if cache_lookups else 0.0
+    )
 
     recommendations = _build_recommendations(
         blocked_count=blocked_attempts,
@@ -167,16 +557,19 @@ def get_insights() -> dict[str, Any]:
         avg_scan_ms=avg_scan_ms,
     )
 
-    recent = events[-_MAX_RECENT_EVENTS:]
+    recent = _load_events(limit=_MAX_RECENT_EVENTS)
     return {
         "summary": {
-            "total_events": len(events),
+            "total_events": agg["total_events"],
             "scan_events": scan_count,
             "act_events": act_count,
             "blocked_attempts": blocked_attempts,
             "execution_success_rate": success_rate,
             "endpoint_errors": dict(endpoint_errors),
             "scenario_distribution": dict(scenario_counter),
+            "decision_cache_hit_rate": cache_hit_rate,
+            "fast_path_decisions": agg["fast_path_decisions"],
+            "llm_decisions": agg["llm_decisions"],
         },
         "latency_ms": {
             "scan_avg": avg_scan_ms,
@@ -186,6 +579,7 @@ def get_insights() -> dict[str, Any]:
             "violation_tags": dict(tag_counter),
             "security_sources": dict(source_counter),
         },
+        "runtime_counters": counters,
         "recommendations": recommendations,
         "recent_events": recent,
     }
@@ -23,18 +23,27 @@ Run locally:
 from __future__ import annotations
 
 import asyncio
+import atexit
+import hashlib
 import logging
 import os
+import queue
+import secrets
 import sys
 import time
-import uuid
+from collections import OrderedDict
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
+from types import MappingProxyType
+from typing import AsyncIterator
 
-import uvicorn
+import httpx
+import orjson
 from dotenv import load_dotenv
 from fastapi import FastAPI, HTTPException, Request
-from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel, Field
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
 
 # ---------------------------------------------------------------------------
 # Ensure the project root is on sys.path so `agent.src.*` imports resolve
@@ -66,23 +75,62 @@ except Exception:
 
 from agent.src import commander, security  # noqa: E402
 from agent.src.learning_engine import get_insights, record_event  # noqa: E402
-from agent.src.orbit_tools import check_conjunction_risk  # noqa: E402
+from agent.src.orbit_tools import (  # noqa: E402
+    check_conjunction_risk,
+    check_conjunction_risk_batch,
+)
 from agent.src import state_manager  # noqa: E402
-from agent.src.vision_tools import analyze_visual_feed  # noqa: E402
+from agent.src.vision_tools import analyze_visual_feed_async  # noqa: E402
 
 # ---------------------------------------------------------------------------
 # Logging
 # ---------------------------------------------------------------------------
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+# Blaxel autoload may already have installed a (colored) root handler; keep
+# whatever is there, but move the actual stream writes onto a background
+# listener so request handlers only enqueue records.
+_root_logger = logging.getLogger()
+_root_logger.setLevel(os.getenv("LOG_LEVEL", "INFO").upper())
+if not _root_logger.handlers:
+    _stream_handler = logging.StreamHandler()
+    _stream_handler.setFormatter(
+        logging.Formatter("%(asctime)s | %(levelname)-8s | %(name)s | %(message)s"),
+    )
+    _root_logger.addHandler(_stream_handler)
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(
+    _log_queue, *_root_logger.handlers, respect_handler_level=True,
 )
+_root_logger.handlers = [QueueHandler(_log_queue)]
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger("vyuha.main")
 
 # ---------------------------------------------------------------------------
 # Agent-loop config
 # ---------------------------------------------------------------------------
 MAX_RETRIES: int = int(os.getenv("MAX_RETRIES", "3"))
+STATE_PERSISTENCE_ENABLED: bool = (
+    os.getenv("STATE_PERSISTENCE", "enabled").lower() == "enabled"
+)
+# SAFE reports below this collision probability are answered with a canned
+# hold without consulting the Commander or the Shield.
+NO_ACT_THRESHOLD: float = float(os.getenv("NO_ACT_THRESHOLD", "0.4"))
+# Start the next Commander call while the Shield is still validating an
+# attempt whose outcome cannot inform it (see act_on_risk).
+SPECULATIVE_RETRY: bool = os.getenv("SPECULATIVE_RETRY", "false").lower() == "true"
+# Candidate plans sampled in parallel (at spread temperatures) on the first
+# Commander attempt when the rule-based fast path cannot answer; the first one
+# the Shield accepts wins.  1 keeps the strictly sequential loop.
+PARALLEL_SAMPLES: int = max(1, int(os.getenv("PARALLEL_SAMPLES", "1")))
+# Fetch the TLE and run one propagation in the background at boot so the
+# first /scan does not pay for it.
+WARMUP_ON_STARTUP: bool = os.getenv("WARMUP_ON_STARTUP", "true").lower() == "true"
+
+# Commander, Shield and vision are awaited directly on the event loop: the
+# Commander owns its pooled LLM client, while White Circle and Overshoot calls
+# share this HTTP/2 client (opened on first use, closed at shutdown).
+HTTP_MAX_KEEPALIVE: int = int(os.getenv("HTTP_MAX_KEEPALIVE", "64"))
+_http: httpx.AsyncClient | None = None
 
 # ---------------------------------------------------------------------------
 # Pydantic request / response models
@@ -96,13 +144,28 @@ class RiskAnalysisRequest(BaseModel):
     )
 
 
+class BatchScanRequest(BaseModel):
+    satellite_id: str = Field(
+        ...,
+        description="Satellite NORAD ID or name (demo uses ISS regardless).",
+        examples=["ISS", "25544"],
+    )
+    epoch_minutes: list[float] = Field(
+        ...,
+        min_length=1,
+        max_length=1440,
+        description="Offsets from now, in minutes, at which to assess conjunction risk.",
+        examples=[[0, 15, 30, 45, 60]],
+    )
+
+
 class ManeuverRequest(BaseModel):
     risk_data: dict = Field(
         ...,
         description="Conjunction-risk report from the /scan endpoint.",
     )
     session_id: str = Field(
-        default_factory=lambda: uuid.uuid4().hex[:12],
+        default_factory=lambda: secrets.token_hex(6),
         description="Session / trace ID for audit logging.",
     )
     simulate_cyberattack: bool = Field(
@@ -115,10 +178,51 @@ class ManeuverRequest(BaseModel):
     )
 
 
+# /act parses its body straight from bytes with a prebuilt validator; the
+# schema is published via openapi_extra so the docs are unchanged.
+_MANEUVER_ADAPTER: TypeAdapter[ManeuverRequest] = TypeAdapter(ManeuverRequest)
+_MANEUVER_OPENAPI: dict = {
+    "requestBody": {
+        "required": True,
+        "content": {
+            "application/json": {"schema": ManeuverRequest.model_json_schema()},
+        },
+    },
+}
+
+
+async def _parse_maneuver_request(http_request: Request) -> ManeuverRequest:
+    try:
+        return _MANEUVER_ADAPTER.validate_json(await http_request.body())
+    except ValidationError as exc:
+        raise RequestValidationError(
+            [
+                {**err, "loc": ("body", *err["loc"])}
+                for err in exc.errors(include_url=False)
+            ],
+        ) from exc
+
+
 # ---------------------------------------------------------------------------
 # FastAPI application
 # ---------------------------------------------------------------------------
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson (numpy scalars included).
+
+    Handlers that build large plain-dict payloads (/act, /insights) return
+    this directly, which also skips FastAPI's pure-Python
+    ``jsonable_encoder`` pass over the body.
+    """
+
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
 app = FastAPI(
+    default_response_class=ORJSONResponse,
     title="Vyuha — The Autonomous Orbital Overseer",
     version="0.2.0",
     description=(
@@ -128,39 +232,63 @@ app = FastAPI(
     ),
 )
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
 
 # ---------------------------------------------------------------------------
-# Request-level middleware — timing + trace IDs
+# Request-level middleware — CORS, timing + trace IDs
 # ---------------------------------------------------------------------------
 
+# The CORS policy is allow-all (any origin, method and header, with
+# credentials), so it is applied inline here rather than through a separate
+# CORSMiddleware layer.  Credentialed requests require the origin to be
+# echoed back instead of "*".
+_CORS_MAX_AGE = "600"
+_CORS_METHODS = "DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+
+
 @app.middleware("http")
 async def add_request_metadata(request: Request, call_next):
-    """Inject a trace ID and measure request latency."""
-    request_id = request.headers.get("X-Request-ID", uuid.uuid4().hex[:12])
-    start = time.perf_counter()
+    """Apply CORS, inject a trace ID and measure request latency."""
+    origin = request.headers.get("origin")
+    if (
+        origin is not None
+        and request.method == "OPTIONS"
+        and "access-control-request-method" in request.headers
+    ):
+        # CORS preflight — answered without touching the router
+        preflight_headers = {
+            "Access-Control-Allow-Origin": origin,
+            "Access-Control-Allow-Credentials": "true",
+            "Access-Control-Allow-Methods": _CORS_METHODS,
+            "Access-Control-Max-Age": _CORS_MAX_AGE,
+            "Vary": "Origin",
+        }
+        requested_headers = request.headers.get("access-control-request-headers")
+        if requested_headers:
+            preflight_headers["Access-Control-Allow-Headers"] = requested_headers
+        return Response(status_code=200, headers=preflight_headers)
+
+    request_id = request.headers.get("X-Request-ID") or secrets.token_hex(6)
+    start = time.perf_counter_ns()
 
     response = await call_next(request)
 
-    elapsed_ms = round((time.perf_counter() - start) * 1000, 1)
+    elapsed_ms = (time.perf_counter_ns() - start) // 1_000_000
     response.headers["X-Request-ID"] = request_id
     response.headers["X-Response-Time-Ms"] = str(elapsed_ms)
+    if origin is not None:
+        response.headers["Access-Control-Allow-Origin"] = origin
+        response.headers["Access-Control-Allow-Credentials"] = "true"
+        response.headers["Vary"] = "Origin"
 
-    logger.info(
-        "%s %s → %s (%s ms)  rid=%s",
-        request.method,
-        request.url.path,
-        response.status_code,
-        elapsed_ms,
-        request_id,
-    )
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "%s %s → %s (%s ms)  rid=%s",
+            request.method,
+            request.scope["path"],
+            response.status_code,
+            elapsed_ms,
+            request_id,
+        )
     return response
 
 
@@ -168,40 +296,126 @@ async def add_request_metadata(request: Request, call_next):
 # Health check
 # ---------------------------------------------------------------------------
 
+# Both bodies depend only on import-time configuration, so they are encoded
+# once; load-balancer probes then cost no dict building or serialisation.
+_HEALTH_BYTES: bytes = orjson.dumps({
+    "status": "ok",
+    "service": "vyuha-ai",
+    "blaxel_sdk": _BLAXEL_READY,
+    "blaxel_telemetry": _BLAXEL_TELEMETRY,
+    "white_circle_configured": bool(
+        os.getenv("WHITE_CIRCLE_API_KEY")
+        and os.getenv("WHITE_CIRCLE_DEPLOYMENT_ID"),
+    ),
+})
+_ROOT_BYTES: bytes = orjson.dumps({
+    "service": "Vyuha — The Autonomous Orbital Overseer",
+    "tagline": "An agentic AI that autonomously navigates the lethal kinetic reality of LEO, securing the $2T space economy.",
+    "status": "operational",
+    "endpoints": ["/health", "/scan", "/scan_batch", "/act", "/act/stream", "/state", "/restore", "/history", "/insights"],
+})
+
+
 @app.get("/health")
 async def health_check():
     """Liveness and deployment verification (Blaxel + White Circle)."""
-    wc_configured = bool(
-        os.getenv("WHITE_CIRCLE_API_KEY")
-        and os.getenv("WHITE_CIRCLE_DEPLOYMENT_ID"),
-    )
-    return {
-        "status": "ok",
-        "service": "vyuha-ai",
-        "blaxel_sdk": _BLAXEL_READY,
-        "blaxel_telemetry": _BLAXEL_TELEMETRY,
-        "white_circle_configured": wc_configured,
-    }
+    return Response(_HEALTH_BYTES, media_type="application/json")
 
 
 @app.get("/")
 async def root():
-    return {
-        "service": "Vyuha — The Autonomous Orbital Overseer",
-        "tagline": "An agentic AI that autonomously navigates the lethal kinetic reality of LEO, securing the $2T space economy.",
-        "status": "operational",
-        "endpoints": ["/health", "/scan", "/act", "/state", "/restore", "/history", "/insights"],
-    }
+    return Response(_ROOT_BYTES, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
 # State management — persistent spacecraft state & maneuver history
 # ---------------------------------------------------------------------------
 
+# Write-behind persistence: handlers update the in-memory state and enqueue
+# a snapshot; one background task writes it to disk.  The queue holds a
+# single pending snapshot, so a burst of updates costs one write.
+_STATE_Q: asyncio.Queue[dict] = asyncio.Queue(maxsize=1)
+_state_writer_task: asyncio.Task | None = None
+
+
+def _persist_state_behind(state: dict) -> None:
+    """Replace any not-yet-written snapshot with *state*."""
+    try:
+        _STATE_Q.put_nowait(state)
+    except asyncio.QueueFull:
+        _STATE_Q.get_nowait()
+        _STATE_Q.task_done()
+        _STATE_Q.put_nowait(state)
+
+
+async def _state_writer() -> None:
+    while True:
+        state = await _STATE_Q.get()
+        try:
+            await asyncio.to_thread(state_manager.save_state, state)
+        except Exception as exc:  # noqa: BLE001
+            logger.error("State persistence failed: %s", exc)
+        finally:
+            _STATE_Q.task_done()
+
+
 @app.on_event("startup")
 async def startup_load_state():
     """Load persisted spacecraft state on startup."""
+    global _state_writer_task
     state_manager.set_state(state_manager.load_state(), persist=False)
+    _state_writer_task = asyncio.create_task(_state_writer())
+
+
+@app.on_event("shutdown")
+async def shutdown_state_writer():
+    """Flush the pending state snapshot before exiting."""
+    await _STATE_Q.join()
+    if _state_writer_task is not None:
+        _state_writer_task.cancel()
+
+
+def _http_client() -> httpx.AsyncClient:
+    """Return the pooled HTTP/2 client for White Circle and Overshoot (event loop only)."""
+    global _http
+    if _http is None:
+        _http = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=HTTP_MAX_KEEPALIVE),
+        )
+    return _http
+
+
+@app.on_event("shutdown")
+async def shutdown_http():
+    """Close pooled White Circle / Overshoot connections."""
+    global _http
+    if _http is not None:
+        await _http.aclose()
+        _http = None
+
+
+_warmup_task: asyncio.Task | None = None
+
+
+def _warm_orbit_engine() -> None:
+    started = time.perf_counter_ns()
+    try:
+        check_conjunction_risk("", "")
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Orbit engine warm-up failed: %s", exc)
+        return
+    logger.info(
+        "Orbit engine warm (%d ms)", (time.perf_counter_ns() - started) // 1_000_000,
+    )
+
+
+@app.on_event("startup")
+async def startup_warmup():
+    """Prime the TLE cache and SGP4 propagation without delaying readiness."""
+    global _warmup_task
+    if WARMUP_ON_STARTUP:
+        _warmup_task = asyncio.create_task(asyncio.to_thread(_warm_orbit_engine))
 
 
 @app.get("/state")
@@ -232,7 +446,8 @@ async def restore_original_trajectory():
     current = state_manager.get_state()
     updated, restored = state_manager.restore_original_trajectory(current)
     if restored:
-        state_manager.set_state(updated, persist=True)
+        state_manager.set_state(updated, persist=False)
+        _persist_state_behind(updated)
         return {
             "status": "TRAJECTORY_RESTORED",
             "message": "Successfully returned to original trajectory",
@@ -251,11 +466,13 @@ async def restore_original_trajectory():
 
 @app.get("/insights")
 async def runtime_insights():
-    return {
+    # A cache miss tails the event file, so keep it off the event loop
+    insights = await asyncio.to_thread(get_insights)
+    return ORJSONResponse({
         "status": "ok",
         "generated_at": time.time(),
-        "insights": get_insights(),
-    }
+        "insights": insights,
+    })
 
 
 # ---------------------------------------------------------------------------
@@ -278,18 +495,23 @@ async def scan_satellite(
         When ``True``, forces a CRITICAL collision scenario while keeping
         the real satellite position (Hybrid Demo Mode).
     """
-    started = time.perf_counter()
+    started = time.perf_counter_ns()
     try:
-        risk_data = await asyncio.to_thread(
-            check_conjunction_risk,
-            "",                       # auto-fetch TLE
-            "",                       # auto-fetch TLE
-            simulate_danger,          # force_critical flag
+        # Orbit propagation and visual threat detection (multimodal —
+        # Overshoot AI) are independent, so they run concurrently: the
+        # blocking TLE fetch / SGP4 on a worker thread, the vision call on
+        # the event loop.
+        risk_data, visual_report = await asyncio.gather(
+            asyncio.to_thread(
+                check_conjunction_risk,
+                "",                       # auto-fetch TLE
+                "",                       # auto-fetch TLE
+                simulate_danger,          # force_critical flag
+            ),
+            analyze_visual_feed_async(_http_client()),
         )
-        # Visual threat detection (multimodal — Overshoot AI)
-        visual_report = await asyncio.to_thread(analyze_visual_feed)
 
-        elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+        elapsed_ms = (time.perf_counter_ns() - started) // 1_000_000
         logger.info(
             "Scan complete for %s — prob=%.4f status=%s mode=%s source=%s vision=%s",
             request.satellite_id,
@@ -327,7 +549,7 @@ async def scan_satellite(
                 "simulate_danger": simulate_danger,
                 "status": "ERROR",
                 "error": str(exc),
-                "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+                "latency_ms": (time.perf_counter_ns() - started) // 1_000_000,
             },
         )
         raise HTTPException(
@@ -336,59 +558,244 @@ async def scan_satellite(
         ) from exc
 
 
+# ---------------------------------------------------------------------------
+# POST /scan_batch — Orbit Engine over a time grid
+# ---------------------------------------------------------------------------
+
+@app.post("/scan_batch")
+def scan_satellite_batch(request: BatchScanRequest):
+    """Assess conjunction risk at several epochs with one vectorised propagation."""
+    started = time.perf_counter_ns()
+    try:
+        reports = check_conjunction_risk_batch(request.epoch_minutes)
+    except Exception as exc:
+        logger.error("Batch orbit propagation failed: %s", exc)
+        raise HTTPException(
+            status_code=500,
+            detail=f"Orbit propagation failed: {exc}",
+        ) from exc
+    elapsed_ms = (time.perf_counter_ns() - started) // 1_000_000
+    logger.info(
+        "Batch scan complete for %s — %d epochs, peak prob=%.4f",
+        request.satellite_id,
+        len(reports),
+        max(report["collision_probability"] for report in reports),
+    )
+    return {
+        "satellite_id": request.satellite_id,
+        "reports": reports,
+        "latency_ms": elapsed_ms,
+    }
+
+
 # ---------------------------------------------------------------------------
 # POST /act — The Agent Loop (Commander → Shield → self-correct)
 # ---------------------------------------------------------------------------
 
 # Synthetic malicious command used when simulate_cyberattack=True (indirect prompt injection demo).
-_MALICIOUS_INJECTED_COMMAND = {
+# Frozen at import; nothing downstream mutates commands, so every request
+# shares one plain-dict snapshot (JSON encoders do not accept a mappingproxy).
+_MALICIOUS_INJECTED_COMMAND = MappingProxyType({
     "action": "FIRE_THRUSTERS",
     "reasoning": "Simulated attacker injection: malicious command to fire thrusters toward debris to cause collision or de-orbit.",
     "recommended_thrust_direction": "TOWARD_DEBRIS",
     "confidence_score": 0.99,
-}
+})
+_MALICIOUS_SNAPSHOT: dict = dict(_MALICIOUS_INJECTED_COMMAND)
 
+# Validated-plan cache: an identical risk report (demo replays, polling UIs)
+# reuses the Commander plan *and* its passing Shield verdict for a short
+# while.  Only plans the Shield accepted are stored.  The event loop is the
+# only accessor, so no lock is needed.
+PLAN_CACHE_SIZE: int = 512
+PLAN_CACHE_TTL_S: float = float(os.getenv("PLAN_CACHE_TTL_S", "60"))
 
-@app.post("/act")
-async def act_on_risk(request: ManeuverRequest):
-    """Run the autonomous Commander → Shield → feedback loop.
+# key -> (monotonic insert time, command, validation)
+_plan_cache: OrderedDict[str, tuple[float, dict, dict]] = OrderedDict()
 
-    1. Commander generates an action plan from the risk data (or synthetic malicious command if simulate_cyberattack=True on attempt 1).
-    2. Shield (White Circle) validates the plan.
-    3. If blocked, the rejection reason is fed back to the Commander for self-correction.
-    4. If all retries fail, a MANUAL_OVERRIDE response is returned.
+
+def _plan_cache_key(risk_data: dict, visual_description: str) -> str | None:
+    try:
+        blob = orjson.dumps(
+            risk_data,
+            option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+    except TypeError:
+        return None
+    digest = hashlib.blake2b(blob, digest_size=16)
+    digest.update(visual_description.encode("utf-8"))
+    return digest.hexdigest()
+
+
+def _plan_cache_get(key: str) -> tuple[dict, dict] | None:
+    entry = _plan_cache.get(key)
+    if entry is None:
+        return None
+    stored_at, command, validation = entry
+    if time.monotonic() - stored_at > PLAN_CACHE_TTL_S:
+        del _plan_cache[key]
+        return None
+    _plan_cache.move_to_end(key)
+    return command, validation
+
+
+def _plan_cache_put(key: str, command: dict, validation: dict) -> None:
+    _plan_cache[key] = (time.monotonic(), command, validation)
+    _plan_cache.move_to_end(key)
+    while len(_plan_cache) > PLAN_CACHE_SIZE:
+        _plan_cache.popitem(last=False)
+
+
+async def _sample_and_validate(
+    risk_data: dict,
+    visual_description: str,
+    session_id: str,
+) -> tuple[dict, dict]:
+    """Sample up to ``PARALLEL_SAMPLES`` distinct Commander plans and validate each.
+
+    Candidates are drawn at different temperatures (see
+    ``commander.sample_decisions_async``) so that, if the Shield blocks one,
+    another is likely to pass without a further Commander round trip.
+    Returns the first accepted model plan (safety fallbacks last) or, if all
+    are blocked, the first candidate with its rejection so the retry loop can
+    continue.
+    """
+    plans = await commander.sample_decisions_async(
+        risk_data, visual_description, PARALLEL_SAMPLES,
+    )
+    verdicts = await asyncio.gather(*(
+        security.validate_command_async(plan, session_id, _http_client())
+        for plan in plans
+    ))
+    results = list(zip(plans, verdicts))
+    accepted = [(plan, verdict) for plan, verdict in results if verdict["valid"]]
+    accepted.sort(key=lambda pair: commander.is_safety_fallback(pair[0]))
+    return accepted[0] if accepted else results[0]
+
+
+def _no_risk_command(risk_data: dict) -> dict | None:
+    """Return a canned hold for clearly safe reports, else ``None``."""
+    probability = risk_data.get("collision_probability")
+    if (
+        risk_data.get("status") != "SAFE"
+        or isinstance(probability, bool)
+        or not isinstance(probability, (int, float))
+        or probability >= NO_ACT_THRESHOLD
+    ):
+        return None
+    return {
+        "action": "HOLD_POSITION",
+        "reasoning": (
+            f"Orbit Engine reports SAFE with collision probability "
+            f"{probability} below {NO_ACT_THRESHOLD}; no maneuver required."
+        ),
+        "confidence_score": round(1.0 - probability, 4),
+        "recommended_thrust_direction": "NONE",
+    }
+
+
+async def _run_agent_loop(
+    request: ManeuverRequest, started: int,
+) -> AsyncIterator[tuple[str, dict]]:
+    """Drive the Commander → Shield → feedback loop for one request.
+
+    Yields ``("attempt", record)`` after every Commander → Shield round and
+    finishes with a single ``("result", response)`` carrying the body that
+    ``/act`` returns.
     """
-    started = time.perf_counter()
     risk_data = request.risk_data
     session_id = request.session_id
     simulate_cyberattack = request.simulate_cyberattack
     visual_description = request.visual_description
 
+    # --- Short-circuit: nothing to decide for a clearly safe report -------
+    if not simulate_cyberattack:
+        hold = _no_risk_command(risk_data)
+        if hold is not None:
+            total_latency_ms = (time.perf_counter_ns() - started) // 1_000_000
+            record_event(
+                "act",
+                {
+                    "session_id": session_id,
+                    "status": "EXECUTED",
+                    "attempts": 0,
+                    "short_circuit": True,
+                    "latency_ms": total_latency_ms,
+                    "risk_status": risk_data.get("status"),
+                    "risk_probability": risk_data.get("collision_probability"),
+                    "attempts_log": [],
+                },
+            )
+            yield "result", {
+                "status": "EXECUTED",
+                "session_id": session_id,
+                "final_command": hold,
+                "attempts": 0,
+                "attempts_log": [],
+                "latency_ms": total_latency_ms,
+                "state_saved": False,
+            }
+            return
+
     rejection_reason: str | None = None
     attempts_log: list[dict] = []
-    workflow_trace: list[dict] = []
     cyberattack_demo_used = False
 
+    speculative: asyncio.Future | None = None
     for attempt in range(1, MAX_RETRIES + 1):
-        attempt_started = time.perf_counter()
+        attempt_started = time.perf_counter_ns()
         # --- Step 1: Commander decides, or synthetic malicious command (cyberattack demo) ---
-        if simulate_cyberattack and attempt == 1:
-            ai_response = _MALICIOUS_INJECTED_COMMAND.copy()
+        injected = simulate_cyberattack and attempt == 1
+        plan_key: str | None = None
+        validation: dict | None = None
+        if injected:
+            ai_response = _MALICIOUS_SNAPSHOT
             cyberattack_demo_used = True
             logger.info("[%s] Cyberattack demo: injecting synthetic malicious command (attempt 1)", session_id)
+        elif speculative is not None:
+            ai_response = await speculative
+            speculative = None
         else:
-            ai_response = await asyncio.to_thread(
-                commander.analyze_situation,
-                risk_data,
-                rejection_reason,
-                visual_description,
+            # A first (feedback-free) attempt on a replayed risk report may
+            # reuse a plan the Shield already cleared.
+            if rejection_reason is None:
+                plan_key = _plan_cache_key(risk_data, visual_description)
+                cached_plan = _plan_cache_get(plan_key) if plan_key else None
+                if cached_plan is not None:
+                    ai_response, validation = cached_plan
+                    plan_key = None
+                    logger.info("[%s] Reusing cached validated plan (attempt %d)", session_id, attempt)
+                elif PARALLEL_SAMPLES > 1:
+                    ai_response, validation = await _sample_and_validate(
+                        risk_data, visual_description, session_id,
+                    )
+            if validation is None:
+                ai_response = await commander.analyze_situation_async(
+                    risk_data, rejection_reason, visual_description,
+                )
+
+        # --- Step 2: Shield validates ------------------------------------
+        if validation is None:
+            shield_future = asyncio.ensure_future(
+                security.validate_command_async(ai_response, session_id, _http_client()),
             )
-
-        # --- Step 2: Shield validates (sync → thread) --------------------
-        validation = await asyncio.to_thread(
-            security.validate_command, ai_response, session_id,
-        )
-
+            # An injected command did not come from the Commander, so its
+            # rejection carries no feedback the Commander could act on: sample
+            # the next plan now and hide it behind the Shield round trip.
+            if SPECULATIVE_RETRY and injected and attempt < MAX_RETRIES:
+                speculative = asyncio.ensure_future(
+                    commander.analyze_situation_async(risk_data, None, visual_description),
+                )
+            validation = await shield_future
+        # A safety hold after an LLM failure is not a plan worth replaying
+        if (
+            plan_key is not None
+            and validation["valid"]
+            and not commander.is_safety_fallback(ai_response)
+        ):
+            _plan_cache_put(plan_key, ai_response, validation)
+
+        # One record per attempt: command, Shield verdict and timing
         attempts_log.append({
             "attempt": attempt,
             "command": ai_response,
@@ -397,26 +804,19 @@ async def act_on_risk(request: ManeuverRequest):
                 "source": validation["source"],
                 "violation_tags": validation["violation_tags"],
             },
+            "attempt_latency_ms": (time.perf_counter_ns() - attempt_started) // 1_000_000,
         })
-        workflow_trace.append(
-            {
-                "attempt": attempt,
-                "decision_action": ai_response.get("action"),
-                "decision_reasoning": ai_response.get("reasoning", ""),
-                "validation_valid": validation["valid"],
-                "validation_source": validation["source"],
-                "violation_tags": validation["violation_tags"],
-                "attempt_latency_ms": round((time.perf_counter() - attempt_started) * 1000, 2),
-            },
-        )
+        yield "attempt", attempts_log[-1]
 
         if validation["valid"]:
+            if speculative is not None:
+                speculative.cancel()
             # --- Safe — execute and return --------------------------------
             logger.info(
                 "[%s] EXECUTED on attempt %d — action=%s",
                 session_id, attempt, ai_response.get("action"),
             )
-            total_latency_ms = round((time.perf_counter() - started) * 1000, 2)
+            total_latency_ms = (time.perf_counter_ns() - started) // 1_000_000
             record_event(
                 "act",
                 {
@@ -430,25 +830,26 @@ async def act_on_risk(request: ManeuverRequest):
                 },
             )
             # Persist spacecraft state after executed maneuver
-            if os.getenv("STATE_PERSISTENCE", "enabled").lower() == "enabled":
+            if STATE_PERSISTENCE_ENABLED:
                 current = state_manager.get_state()
                 updated = state_manager.apply_maneuver(current, risk_data, ai_response)
-                state_manager.set_state(updated, persist=True)
+                state_manager.set_state(updated, persist=False)
+                _persist_state_behind(updated)
             resp: dict = {
                 "status": "EXECUTED",
                 "session_id": session_id,
                 "final_command": ai_response,
                 "attempts": attempt,
                 "attempts_log": attempts_log,
-                "workflow_trace": workflow_trace,
                 "latency_ms": total_latency_ms,
-                "state_saved": os.getenv("STATE_PERSISTENCE", "enabled").lower() == "enabled",
+                "state_saved": STATE_PERSISTENCE_ENABLED,
             }
             if cyberattack_demo_used:
                 resp["cyberattack_demo"] = True
                 resp["attack_vector"] = "indirect_prompt_injection"
                 resp["resilience"] = "White Circle blocked malicious attempt; Commander issued safe command on retry."
-            return resp
+            yield "result", resp
+            return
 
         # --- Unsafe — prepare feedback for next iteration -----------------
         rejection_reason = security.format_rejection_message(
@@ -463,7 +864,7 @@ async def act_on_risk(request: ManeuverRequest):
     logger.error(
         "[%s] MANUAL_OVERRIDE after %d failed attempts", session_id, MAX_RETRIES,
     )
-    total_latency_ms = round((time.perf_counter() - started) * 1000, 2)
+    total_latency_ms = (time.perf_counter_ns() - started) // 1_000_000
     record_event(
         "act",
         {
@@ -486,13 +887,60 @@ async def act_on_risk(request: ManeuverRequest):
         "last_blocked_command": ai_response,
         "attempts": MAX_RETRIES,
         "attempts_log": attempts_log,
-        "workflow_trace": workflow_trace,
         "latency_ms": total_latency_ms,
     }
     if cyberattack_demo_used:
         override_resp["cyberattack_demo"] = True
         override_resp["attack_vector"] = "indirect_prompt_injection"
-    return override_resp
+    yield "result", override_resp
+
+
+@app.post("/act", openapi_extra=_MANEUVER_OPENAPI)
+async def act_on_risk(http_request: Request, include_log: bool = True):
+    """Run the autonomous Commander → Shield → feedback loop.
+
+    0. SAFE reports below ``NO_ACT_THRESHOLD`` return a canned HOLD_POSITION immediately.
+    1. Commander generates an action plan from the risk data (or synthetic malicious command if simulate_cyberattack=True on attempt 1).
+    2. Shield (White Circle) validates the plan.
+    3. If blocked, the rejection reason is fed back to the Commander for self-correction.
+    4. If all retries fail, a MANUAL_OVERRIDE response is returned.
+
+    Pass ``?include_log=false`` to omit ``attempts_log`` from the response;
+    it is still recorded for ``/insights``.
+    """
+    started = time.perf_counter_ns()
+    request = await _parse_maneuver_request(http_request)
+    result: dict = {}
+    async for kind, payload in _run_agent_loop(request, started):
+        if kind == "result":
+            result = payload
+    if not include_log:
+        del result["attempts_log"]
+    return ORJSONResponse(result)
+
+
+@app.post("/act/stream", openapi_extra=_MANEUVER_OPENAPI)
+async def act_on_risk_stream(http_request: Request):
+    """Same loop as ``/act``, streamed as Server-Sent Events.
+
+    Emits one ``attempt`` event per Commander → Shield round as it completes,
+    then a ``result`` event whose data is the body ``/act`` would return.
+    """
+    started = time.perf_counter_ns()
+    # Parse up front so malformed bodies still get a 422, not a broken stream
+    request = await _parse_maneuver_request(http_request)
+
+    async def events() -> AsyncIterator[bytes]:
+        async for kind, payload in _run_agent_loop(request, started):
+            yield b"event: " + kind.encode() + b"\ndata: " + orjson.dumps(
+                payload, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+            ) + b"\n\n"
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 
 # ---------------------------------------------------------------------------
@@ -500,12 +948,38 @@ async def act_on_risk(request: ManeuverRequest):
 # ---------------------------------------------------------------------------
 
 if __name__ == "__main__":
+    # Only the dev/Blaxel entrypoint needs the server package; importing the
+    # app from another ASGI server skips it.
+    import uvicorn
+
     host = os.getenv("HOST", "0.0.0.0")
     port = int(os.getenv("PORT", "8000"))
     reload_enabled = os.getenv("RELOAD", "false").lower() == "true"
+    # Spacecraft state, caches and the insight aggregate live in-process, so
+    # extra workers each keep their own copy; scale out deliberately.
+    # WORKERS=auto runs one async worker process per CPU core.
+    workers_env = os.getenv("WORKERS", "1").strip().lower()
+    workers = (os.cpu_count() or 1) if workers_env == "auto" else int(workers_env)
+    # ``python -m`` ran this file as ``__main__``; register it under its
+    # import name so uvicorn's "agent.src.main:app" lookup reuses it instead
+    # of executing the module (autoload, app construction) a second time.
+    sys.modules.setdefault("agent.src.main", sys.modules[__name__])
     uvicorn.run(
         "agent.src.main:app",
         host=host,
         port=port,
         reload=reload_enabled,
+        workers=None if reload_enabled else workers,
+        # "auto" picks uvloop/httptools when installed and falls back to
+        # asyncio/h11 otherwise.
+        loop=os.getenv("UVICORN_LOOP", "auto"),
+        http=os.getenv("UVICORN_HTTP", "auto"),
+        # Deeper accept queue for connection bursts; keep idle client
+        # connections (dashboard polling) open across requests.
+        backlog=int(os.getenv("BACKLOG", "2048")),
+        timeout_keep_alive=int(os.getenv("KEEP_ALIVE_TIMEOUT_S", "30")),
+        # Logging is configured above; the request middleware already logs
+        # one line per request, so uvicorn's access log would only repeat it.
+        log_config=None,
+        access_log=False,
     )
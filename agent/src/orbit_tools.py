@@ -18,15 +18,21 @@ Run standalone for local testing:
 
 from __future__ import annotations
 
-import hashlib
 import logging
-import random
+import os
+import threading
+import time
+import zlib
+from bisect import bisect_left
 from datetime import datetime, timezone
+from functools import lru_cache
 
 import numpy as np
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from mcp.server.fastmcp import FastMCP
-from skyfield.api import EarthSatellite, load
+from skyfield.api import EarthSatellite, load, wgs84
 
 # ---------------------------------------------------------------------------
 # MCP server
@@ -45,17 +51,45 @@ CELESTRAK_URL = (
     "https://celestrak.org/NORAD/elements/gp.php?GROUP=stations&FORMAT=tle"
 )
 
+# Pooled keep-alive session so repeat calls skip the TCP/TLS handshake;
+# gateway errors (502/503/504) are retried with a short backoff.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2, connect=0, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+        ),
+    ),
+)
+
 # Hardcoded fallback TLE — used when CelesTrak is unreachable
 _FALLBACK_TLE = (
     "1 25544U 98067A   24100.50000000  .00016717  00000-0  10270-3 0  9002",
     "2 25544  51.6400 208.9163 0002894 121.1600 239.0100 15.49999029999990",
 )
 
+# TLEs are republished on an hours timescale, so fetched element sets are
+# reused for TLE_CACHE_TTL_S seconds. One download refreshes every satellite
+# in the CelesTrak group, concurrent misses share that request, and a stale
+# entry is served if a refresh fails.
+TLE_CACHE_TTL_S: float = float(os.getenv("TLE_CACHE_TTL_S", "3600"))
+
+# satellite name (upper-cased) -> (monotonic fetch time, (line1, line2))
+_TLE_CACHE: dict[str, tuple[float, tuple[str, str]]] = {}
+_TLE_FETCH_LOCK = threading.Lock()
+
 
 def fetch_live_tle(
     satellite_name: str = "ISS (ZARYA)",
 ) -> tuple[str, str]:
-    """Fetch the latest TLE for a satellite from CelesTrak.
+    """Return the latest TLE for a satellite, cached for ``TLE_CACHE_TTL_S``.
+
+    Fresh cache entries are returned without touching the network. On a
+    miss the TLE is fetched from CelesTrak; if that fails and an expired
+    entry exists, the expired entry is returned instead of raising.
 
     Parameters
     ----------
@@ -75,28 +109,62 @@ def fetch_live_tle(
     requests.RequestException
         On network / HTTP errors.
     """
-    resp = requests.get(CELESTRAK_URL, timeout=15)
-    resp.raise_for_status()
-
-    lines = [line.strip() for line in resp.text.strip().splitlines() if line.strip()]
-
-    # TLE format: name, line1, line2 — repeating in groups of 3
-    for i, line in enumerate(lines):
-        if line.upper() == satellite_name.upper():
-            if i + 2 < len(lines):
-                tle1 = lines[i + 1]
-                tle2 = lines[i + 2]
-                logger.info(
-                    "Live TLE fetched for '%s' — epoch in line1: %s",
-                    satellite_name,
-                    tle1[18:32],
-                )
-                return tle1, tle2
-
-    raise ValueError(
-        f"Satellite '{satellite_name}' not found in CelesTrak response "
-        f"({len(lines)} lines parsed)"
+    key = satellite_name.upper()
+    cached = _TLE_CACHE.get(key)
+    if cached is not None and time.monotonic() - cached[0] < TLE_CACHE_TTL_S:
+        return cached[1]
+
+    with _TLE_FETCH_LOCK:
+        # Another thread may have refreshed the entry while we waited
+        cached = _TLE_CACHE.get(key)
+        if cached is not None and time.monotonic() - cached[0] < TLE_CACHE_TTL_S:
+            return cached[1]
+        try:
+            catalogue = _fetch_catalogue_from_celestrak()
+        except Exception as exc:
+            if cached is None:
+                raise
+            logger.warning(
+                "TLE refresh for '%s' failed (%s) — serving cached TLE",
+                satellite_name,
+                exc,
+            )
+            return cached[1]
+        fetched_at = time.monotonic()
+        for name, pair in catalogue.items():
+            _TLE_CACHE[name] = (fetched_at, pair)
+
+    tle = catalogue.get(key)
+    if tle is None:
+        raise ValueError(
+            f"Satellite '{satellite_name}' not found in CelesTrak response "
+            f"({len(catalogue)} satellites parsed)"
+        )
+    logger.info(
+        "Live TLE fetched for '%s' — epoch in line1: %s",
+        satellite_name,
+        tle[0][18:32],
     )
+    return tle
+
+
+def _fetch_catalogue_from_celestrak() -> dict[str, tuple[str, str]]:
+    """Download the CelesTrak stations file and index every TLE by name (uncached)."""
+    # Every name is cached, so the whole file is read — but line by line off
+    # the socket rather than via one body string and a split copy of it.
+    with _HTTP_SESSION.get(CELESTRAK_URL, timeout=15, stream=True) as resp:
+        resp.raise_for_status()
+        resp.encoding = resp.encoding or "utf-8"
+        lines = (
+            stripped
+            for line in resp.iter_lines(decode_unicode=True)
+            if (stripped := line.strip())
+        )
+        # TLE format: name, line1, line2 — repeating in groups of 3
+        return {
+            name.upper(): (tle1, tle2)
+            for name, tle1, tle2 in zip(lines, lines, lines)
+        }
 
 
 # ---------------------------------------------------------------------------
@@ -110,8 +178,28 @@ def _deterministic_seed(tle_line1: str, tle_line2: str, minute: int) -> int:
     TLE pair (useful for demos) while still varying across satellites and
     across time.
     """
-    payload = f"{tle_line1.strip()}|{tle_line2.strip()}|{minute}"
-    return int(hashlib.sha256(payload.encode()).hexdigest()[:8], 16)
+    # Only 32 well-mixed bits are needed, not a cryptographic digest; hash
+    # the raw bytes rather than formatting a string first
+    payload = b"|".join((
+        tle_line1.strip().encode(),
+        tle_line2.strip().encode(),
+        minute.to_bytes(4, "little"),
+    ))
+    return zlib.crc32(payload)
+
+
+@lru_cache(maxsize=256)
+def _satellite_for(tle_line1: str, tle_line2: str) -> EarthSatellite:
+    """Return a propagator for a TLE pair, initialising SGP4 only once.
+
+    A TLE only changes when CelesTrak publishes a new epoch, so repeated
+    scans of the same satellite reuse the parsed elements.
+    """
+    return EarthSatellite(tle_line1, tle_line2, "TARGET", ts)
+
+
+# Parse the fallback TLE at import so the offline path finds it in the cache
+_satellite_for(*_FALLBACK_TLE)
 
 
 def _simulate_debris_encounter(seed: int) -> tuple[float, float]:
@@ -120,13 +208,66 @@ def _simulate_debris_encounter(seed: int) -> tuple[float, float]:
     Uses a seeded RNG so repeated calls within the same minute are
     deterministic — handy when the LLM retries or the UI polls.
     """
-    rng = random.Random(seed)
-    distance_km = rng.uniform(1.0, 50.0)
+    probabilities, distances = _simulate_debris_encounter_batch(seed, 1)
+    return float(probabilities[0]), float(distances[0])
+
+
+def _simulate_debris_encounter_batch(seed: int, n: int) -> tuple[np.ndarray, np.ndarray]:
+    """Draw *n* debris scenarios from one seeded PCG64 generator.
+
+    Returns ``(collision_probabilities, distances_km)`` arrays, rounded like
+    :func:`_simulate_debris_encounter` (which is the ``n=1`` case), so
+    Monte Carlo sweeps run as single vectorised passes.
+    """
+    rng = np.random.default_rng(seed)
+    distance_km = rng.uniform(1.0, 50.0, size=n)
     # Closer debris → higher probability (inverse-square-ish relationship)
     raw_prob = 1.0 / (1.0 + (distance_km / 5.0) ** 2)
     # Add a small stochastic nudge so it isn't perfectly monotonic
-    collision_probability = round(min(max(raw_prob + rng.gauss(0, 0.05), 0.0), 1.0), 4)
-    return collision_probability, round(distance_km, 3)
+    noisy = raw_prob + rng.normal(0.0, 0.05, size=n)
+    return np.round(np.clip(noisy, 0.0, 1.0), 4), np.round(distance_km, 3)
+
+
+@lru_cache(maxsize=512)
+def _debris_for_minute(tle_line1: str, tle_line2: str, minute: int) -> tuple[float, float]:
+    """Simulated debris encounter for a TLE pair in a given UTC minute.
+
+    The result is a pure function of its arguments, so polls landing in the
+    same minute skip the seed hash and RNG draws.  Position is not cached —
+    the satellite moves several km per second.
+    """
+    return _simulate_debris_encounter(_deterministic_seed(tle_line1, tle_line2, minute))
+
+
+def _resolve_tle(
+    satellite_tle_line1: str, satellite_tle_line2: str,
+) -> tuple[str, str, str]:
+    """Return ``(line1, line2, data_source)``: given TLE → live fetch → fallback."""
+    if satellite_tle_line1.strip() and satellite_tle_line2.strip():
+        return satellite_tle_line1, satellite_tle_line2, "User-Provided"
+    try:
+        line1, line2 = fetch_live_tle()
+        return line1, line2, "CelesTrak (Live)"
+    except Exception as exc:
+        logger.warning("Live TLE fetch failed (%s) — using fallback", exc)
+        return _FALLBACK_TLE[0], _FALLBACK_TLE[1], "Hardcoded Fallback"
+
+
+# Status bands: SAFE ≤ 0.4 < WARNING ≤ 0.7 < CRITICAL (upper bounds inclusive,
+# hence bisect_left / searchsorted side="left").
+_STATUS_THRESHOLDS: tuple[float, ...] = (0.4, 0.7)
+_STATUS_LABELS: tuple[str, ...] = ("SAFE", "WARNING", "CRITICAL")
+_STATUS_LABEL_ARRAY = np.array(_STATUS_LABELS)
+
+
+def _risk_status(collision_probability: float) -> str:
+    """Map a collision probability to the actionable status label."""
+    return _STATUS_LABELS[bisect_left(_STATUS_THRESHOLDS, collision_probability)]
+
+
+def _risk_statuses(collision_probabilities: np.ndarray) -> np.ndarray:
+    """Vectorised :func:`_risk_status` over an array of probabilities."""
+    return _STATUS_LABEL_ARRAY[np.searchsorted(_STATUS_THRESHOLDS, collision_probabilities)]
 
 
 # ---------------------------------------------------------------------------
@@ -163,31 +304,30 @@ def check_conjunction_risk(
         Conjunction risk report including geocentric position, simulated
         collision probability, data source, and an actionable status label.
     """
-    # --- Resolve TLE: live fetch → fallback --------------------------------
-    data_source: str
-    if not satellite_tle_line1.strip() or not satellite_tle_line2.strip():
-        try:
-            satellite_tle_line1, satellite_tle_line2 = fetch_live_tle()
-            data_source = "CelesTrak (Live)"
-        except Exception as exc:
-            logger.warning("Live TLE fetch failed (%s) — using fallback", exc)
-            satellite_tle_line1, satellite_tle_line2 = _FALLBACK_TLE
-            data_source = "Hardcoded Fallback"
-    else:
-        data_source = "User-Provided"
+    satellite_tle_line1, satellite_tle_line2, data_source = _resolve_tle(
+        satellite_tle_line1, satellite_tle_line2,
+    )
+    return _assess_conjunction(
+        satellite_tle_line1, satellite_tle_line2, data_source, force_critical,
+    )
+
 
+def _assess_conjunction(
+    satellite_tle_line1: str,
+    satellite_tle_line2: str,
+    data_source: str,
+    force_critical: bool,
+) -> dict:
     # --- Propagate the orbit -----------------------------------------------
-    satellite = EarthSatellite(
+    satellite = _satellite_for(
         satellite_tle_line1.strip(),
         satellite_tle_line2.strip(),
-        "TARGET",
-        ts,
     )
     now = ts.now()
     geocentric = satellite.at(now)
 
-    # Sub-satellite point (geodetic lat/lon/alt)
-    subpoint = geocentric.subpoint()
+    # Sub-satellite point (WGS84 geodetic lat/lon/alt), one frame rotation
+    subpoint = wgs84.geographic_position_of(geocentric)
     latitude = round(subpoint.latitude.degrees, 6)
     longitude = round(subpoint.longitude.degrees, 6)
     altitude_km = round(subpoint.elevation.km, 3)
@@ -203,18 +343,11 @@ def check_conjunction_risk(
         scenario_mode = "SYNTHETIC_DEBRIS_INJECTION"
         logger.info("Force-critical mode: injecting synthetic debris threat")
     else:
-        seed = _deterministic_seed(
+        collision_probability, distance_to_debris_km = _debris_for_minute(
             satellite_tle_line1, satellite_tle_line2, utc_now.minute,
         )
-        collision_probability, distance_to_debris_km = _simulate_debris_encounter(seed)
         scenario_mode = "LIVE_OBSERVATION"
-
-        if collision_probability > 0.7:
-            status = "CRITICAL"
-        elif collision_probability > 0.4:
-            status = "WARNING"
-        else:
-            status = "SAFE"
+        status = _risk_status(collision_probability)
 
     result: dict = {
         "timestamp": utc_now.isoformat(),
@@ -231,10 +364,76 @@ def check_conjunction_risk(
     return result
 
 
+def check_conjunction_risk_batch(
+    epoch_minutes: list[float],
+    satellite_tle_line1: str = "",
+    satellite_tle_line2: str = "",
+) -> list[dict]:
+    """Assess conjunction risk at several epochs with one SGP4 propagation.
+
+    Parameters
+    ----------
+    epoch_minutes : list of float
+        Offsets from now, in minutes, at which to evaluate the orbit.
+    satellite_tle_line1, satellite_tle_line2 : str, optional
+        TLE to propagate; the live ISS TLE is used when omitted.
+
+    Returns
+    -------
+    list of dict
+        One report per epoch, in input order, shaped like
+        :func:`check_conjunction_risk` output.
+    """
+    satellite_tle_line1, satellite_tle_line2, data_source = _resolve_tle(
+        satellite_tle_line1, satellite_tle_line2,
+    )
+    satellite_tle_line1 = satellite_tle_line1.strip()
+    satellite_tle_line2 = satellite_tle_line2.strip()
+
+    # Skyfield propagates a whole Time array in a single vectorised call
+    satellite = _satellite_for(satellite_tle_line1, satellite_tle_line2)
+    offsets_days = np.asarray(epoch_minutes, dtype=np.float64) / 1440.0
+    times = ts.tt_jd(ts.now().tt + offsets_days)
+    subpoint = wgs84.geographic_position_of(satellite.at(times))
+    latitudes = np.round(subpoint.latitude.degrees, 6).tolist()
+    longitudes = np.round(subpoint.longitude.degrees, 6).tolist()
+    altitudes = np.round(subpoint.elevation.km, 3).tolist()
+
+    fetched_at = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    epochs = times.utc_datetime()
+    encounters = [
+        _debris_for_minute(satellite_tle_line1, satellite_tle_line2, epoch.minute)
+        for epoch in epochs
+    ]
+    statuses = _risk_statuses(np.array([prob for prob, _ in encounters])).tolist()
+    return [
+        {
+            "timestamp": epoch.isoformat(),
+            "epoch_offset_min": float(epoch_minutes[i]),
+            "latitude": latitudes[i],
+            "longitude": longitudes[i],
+            "altitude_km": altitudes[i],
+            "distance_to_debris_km": encounters[i][1],
+            "collision_probability": encounters[i][0],
+            "status": statuses[i],
+            "scenario_mode": "LIVE_OBSERVATION",
+            "data_source": f"{data_source} (Live Fetch: {fetched_at})",
+        }
+        for i, epoch in enumerate(epochs)
+    ]
+
+
 # ---------------------------------------------------------------------------
 # Tool 2 — Avoidance Maneuver Calculation
 # ---------------------------------------------------------------------------
 
+# Maneuver model parameters
+_BURN_RISK_THRESHOLD = 0.7      # act at or above this collision probability
+_MIN_FUEL_PCT = 10.0            # below this no burn is attempted
+_THRUSTER_ACCEL_MS2 = 0.1       # small monopropellant thruster
+_FUEL_PCT_PER_MS = 0.8          # rough fuel cost per m/s of delta-v
+
+
 @mcp.tool()
 def calculate_avoidance_maneuver(
     risk_probability: float,
@@ -256,14 +455,14 @@ def calculate_avoidance_maneuver(
         Maneuver plan, or a status message if no burn is required / possible.
     """
     # --- Guard: risk below action threshold ---
-    if risk_probability < 0.7:
+    if risk_probability < _BURN_RISK_THRESHOLD:
         return {
             "action": "NO_ACTION",
             "reason": "Collision probability below threshold (< 0.7). No maneuver required.",
         }
 
     # --- Guard: insufficient fuel ---
-    if fuel_level < 10.0:
+    if fuel_level < _MIN_FUEL_PCT:
         return {
             "action": "ALERT",
             "reason": (
@@ -276,15 +475,14 @@ def calculate_avoidance_maneuver(
     # --- Compute burn parameters ---
     # Delta-v scales with risk; baseline ~0.5 m/s at p=0.7, up to ~2.5 m/s
     # at p=1.0.  Uses a quadratic ramp for a slightly conservative profile.
-    normalised_risk = (risk_probability - 0.7) / 0.3          # 0 → 1
+    normalised_risk = (risk_probability - _BURN_RISK_THRESHOLD) / 0.3   # 0 → 1
     delta_v_ms = round(0.5 + 2.0 * (normalised_risk ** 1.5), 4)
 
     # Burn duration assuming a small monopropellant thruster (~0.1 m/s² accel)
-    thruster_accel = 0.1  # m/s²
-    burn_duration_sec = round(delta_v_ms / thruster_accel, 2)
+    burn_duration_sec = round(delta_v_ms / _THRUSTER_ACCEL_MS2, 2)
 
     # Fuel cost estimate (rough: 0.8 % per m/s of delta-v)
-    fuel_cost_pct = round(delta_v_ms * 0.8, 2)
+    fuel_cost_pct = round(delta_v_ms * _FUEL_PCT_PER_MS, 2)
 
     return {
         "action": "FIRE_THRUSTERS",
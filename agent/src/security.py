@@ -15,11 +15,18 @@ Usage:
 from __future__ import annotations
 
 import json
+import logging
 import os
+import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Any
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 
 # ---------------------------------------------------------------------------
@@ -27,6 +34,8 @@ from dotenv import load_dotenv
 # ---------------------------------------------------------------------------
 load_dotenv()
 
+logger = logging.getLogger("vyuha.security")
+
 WHITE_CIRCLE_API_KEY: str = os.getenv("WHITE_CIRCLE_API_KEY", "")
 WHITE_CIRCLE_BASE_URL: str = os.getenv("WHITE_CIRCLE_BASE_URL", "https://us.whitecircle.ai").rstrip("/")
 WHITE_CIRCLE_VERSION: str = os.getenv("WHITE_CIRCLE_VERSION", "2025-12-01")
@@ -36,6 +45,20 @@ WHITE_CIRCLE_DEPLOYMENT_ID: str = (
     or os.getenv("WHITE_CIRCLE_POLICY_ID", "")
 )
 
+# Pooled keep-alive session so repeat calls skip the TCP/TLS handshake;
+# gateway errors (502/503/504) are retried with a short backoff.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount(
+    "https://",
+    HTTPAdapter(
+        pool_connections=4,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=2, connect=0, backoff_factor=0.2, status_forcelist=[502, 503, 504],
+        ),
+    ),
+)
+
 # ---------------------------------------------------------------------------
 # Local deny-list (always-on safety net)
 # ---------------------------------------------------------------------------
@@ -50,15 +73,24 @@ BLOCKED_KEYWORDS: set[str] = {
     "DISABLE_SHIELD",
 }
 
+# All keywords compiled into one pattern so a command is scanned in a single
+# pass.  The zero-width lookahead matches at every offset, so overlapping
+# keywords (DESTRUCT inside SELF_DESTRUCT) are all reported, exactly like
+# per-keyword substring tests.  Rebuild if BLOCKED_KEYWORDS is changed.
+_BLOCKED_PATTERN = re.compile(
+    "(?=({}))".format(
+        "|".join(re.escape(kw) for kw in sorted(BLOCKED_KEYWORDS, key=len, reverse=True)),
+    ),
+)
 
-def check_content(
-    *,
+
+def _check_request(
     messages: list[dict[str, Any]],
-    external_session_id: str | None = None,
-    include_context: bool = False,
-    metadata: dict[str, Any] | None = None,
-) -> dict[str, Any]:
-    """Call White Circle /api/session/check with documented payload."""
+    external_session_id: str | None,
+    include_context: bool,
+    metadata: dict[str, Any] | None,
+) -> tuple[str, dict[str, str], dict[str, Any]]:
+    """Return ``(url, headers, payload)`` for a White Circle session check."""
     if not WHITE_CIRCLE_API_KEY:
         raise RuntimeError("WHITE_CIRCLE_API_KEY is not configured")
     if not WHITE_CIRCLE_DEPLOYMENT_ID:
@@ -75,89 +107,142 @@ def check_content(
     if metadata:
         payload["metadata"] = metadata
 
-    response = requests.post(
-        f"{WHITE_CIRCLE_BASE_URL}/api/session/check",
-        headers={
-            "Authorization": f"Bearer {WHITE_CIRCLE_API_KEY}",
-            "Content-Type": "application/json",
-            "whitecircle-version": WHITE_CIRCLE_VERSION,
-        },
-        json=payload,
-        timeout=20,
+    headers = {
+        "Authorization": f"Bearer {WHITE_CIRCLE_API_KEY}",
+        "Content-Type": "application/json",   # body is pre-encoded with orjson
+        "whitecircle-version": WHITE_CIRCLE_VERSION,
+    }
+    return f"{WHITE_CIRCLE_BASE_URL}/api/session/check", headers, payload
+
+
+def check_content(
+    *,
+    messages: list[dict[str, Any]],
+    external_session_id: str | None = None,
+    include_context: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Call White Circle /api/session/check with documented payload."""
+    url, headers, payload = _check_request(
+        messages, external_session_id, include_context, metadata,
     )
+    response = _HTTP_SESSION.post(url, headers=headers, data=orjson.dumps(payload), timeout=20)
     if not response.ok:
         raise RuntimeError(
             "White Circle check failed "
             f"({response.status_code}): {response.text[:500]}"
         )
-    return response.json()
+    return orjson.loads(response.content)
+
+
+async def check_content_async(
+    client: httpx.AsyncClient,
+    *,
+    messages: list[dict[str, Any]],
+    external_session_id: str | None = None,
+    include_context: bool = False,
+    metadata: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Async :func:`check_content` over a caller-owned, pooled *client*."""
+    url, headers, payload = _check_request(
+        messages, external_session_id, include_context, metadata,
+    )
+    response = await client.post(url, headers=headers, content=orjson.dumps(payload), timeout=20)
+    if not response.is_success:
+        raise RuntimeError(
+            "White Circle check failed "
+            f"({response.status_code}): {response.text[:500]}"
+        )
+    return orjson.loads(response.content)
 
 
 def _extract_violation_tags(policies: dict[str, Any]) -> list[str]:
-    tags: list[str] = []
-    for policy_id, policy in policies.items():
-        if policy.get("flagged"):
-            policy_name = policy.get("name", policy_id)
-            flagged_source = policy.get("flagged_source", [])
-            if flagged_source:
-                tags.append(f"{policy_name}:{','.join(flagged_source)}")
-            else:
-                tags.append(policy_name)
-    return tags
+    return [
+        f"{policy.get('name', policy_id)}:{','.join(policy['flagged_source'])}"
+        if policy.get("flagged_source")
+        else policy.get("name", policy_id)
+        for policy_id, policy in policies.items()
+        if policy.get("flagged")
+    ]
 
 
-def validate_command(command_json: dict, session_id: str) -> dict:
-    """Validate commander command using local + White Circle checks."""
-    timestamp = datetime.now(timezone.utc).isoformat()
-    command_str = json.dumps(command_json)
+def _iter_strings(obj: Any):
+    """Yield every string key and string leaf of a JSON-like value."""
+    if isinstance(obj, str):
+        yield obj
+    elif isinstance(obj, dict):
+        for key, value in obj.items():
+            if isinstance(key, str):
+                yield key
+            yield from _iter_strings(value)
+    elif isinstance(obj, (list, tuple)):
+        for item in obj:
+            yield from _iter_strings(item)
 
-    # Pass 1: local deny-list
-    upper_command = command_str.upper()
-    local_violations = sorted([kw for kw in BLOCKED_KEYWORDS if kw in upper_command])
-    if local_violations:
-        return {
-            "valid": False,
-            "session_id": session_id,
-            "timestamp": timestamp,
-            "source": "local_deny_list",
-            "violation_tags": local_violations,
-            "original_command": command_json,
-        }
 
-    # Pass 2: White Circle Check Content API
-    if WHITE_CIRCLE_API_KEY and WHITE_CIRCLE_DEPLOYMENT_ID:
-        try:
-            result = check_content(
-                messages=[
-                    {
-                        "role": "assistant",
-                        "content": command_str,
-                        "metadata": {
-                            "assistant": {"model_name": "vyuha-commander"},
-                            "message": {"timestamp": timestamp},
-                        },
-                    },
-                ],
-                external_session_id=session_id,
-                include_context=False,
-                metadata={"environment": {"name": "vyuha-ai"}},
-            )
-            flagged = bool(result.get("flagged", False))
-            policies = result.get("policies", {}) if isinstance(result.get("policies"), dict) else {}
-            tags = _extract_violation_tags(policies)
-            return {
-                "valid": not flagged,
-                "session_id": session_id,
-                "timestamp": timestamp,
-                "source": "white_circle_check_api",
-                "violation_tags": tags,
-                "original_command": command_json,
-                "white_circle_internal_session_id": result.get("internal_session_id"),
-            }
-        except Exception as exc:  # noqa: BLE001
-            print(f"[Shield] White Circle API error: {exc}")
+# Keys ("action", "reasoning", ...) and action values repeat across every
+# command and retry, so their scan results are memoised.
+@lru_cache(maxsize=512)
+def _blocked_keywords_in(text: str) -> frozenset[str]:
+    return frozenset(m.group(1) for m in _BLOCKED_PATTERN.finditer(text.upper()))
 
-    # Pass 3: fallback
+
+def _local_verdict(command_json: dict, session_id: str, timestamp: str) -> dict | None:
+    """Pass 1: local deny-list. Returns a blocking verdict or ``None``."""
+    # Scan the command's own strings; no need to serialise it first
+    local_violations = sorted(frozenset().union(
+        *map(_blocked_keywords_in, _iter_strings(command_json)),
+    ))
+    if not local_violations:
+        return None
+    return {
+        "valid": False,
+        "session_id": session_id,
+        "timestamp": timestamp,
+        "source": "local_deny_list",
+        "violation_tags": local_violations,
+        "original_command": command_json,
+    }
+
+
+def _white_circle_kwargs(command_json: dict, session_id: str, timestamp: str) -> dict[str, Any]:
+    command_str = orjson.dumps(command_json).decode()
+    return {
+        "messages": [
+            {
+                "role": "assistant",
+                "content": command_str,
+                "metadata": {
+                    "assistant": {"model_name": "vyuha-commander"},
+                    "message": {"timestamp": timestamp},
+                },
+            },
+        ],
+        "external_session_id": session_id,
+        "include_context": False,
+        "metadata": {"environment": {"name": "vyuha-ai"}},
+    }
+
+
+def _white_circle_verdict(result: dict[str, Any], command_json: dict, session_id: str, timestamp: str) -> dict:
+    flagged = bool(result.get("flagged", False))
+    try:
+        tags = _extract_violation_tags(result["policies"])
+    except (KeyError, AttributeError, TypeError):
+        tags = []
+    return {
+        "valid": not flagged,
+        "session_id": session_id,
+        "timestamp": timestamp,
+        "source": "white_circle_check_api",
+        "violation_tags": tags,
+        "original_command": command_json,
+        "white_circle_internal_session_id": result.get("internal_session_id"),
+    }
+
+
+def _fallback_verdict(command_json: dict, session_id: str, timestamp: str) -> dict:
+    """Pass 3: White Circle not configured or unreachable."""
     return {
         "valid": True,
         "session_id": session_id,
@@ -168,7 +253,62 @@ def validate_command(command_json: dict, session_id: str) -> dict:
     }
 
 
+def validate_command(command_json: dict, session_id: str) -> dict:
+    """Validate commander command using local + White Circle checks.
+
+    The verdict's ``original_command`` is *command_json* itself, not a copy;
+    callers must not mutate it afterwards.
+    """
+    timestamp = datetime.now(timezone.utc).isoformat()
+
+    # Pass 1: local deny-list
+    blocked = _local_verdict(command_json, session_id, timestamp)
+    if blocked is not None:
+        return blocked
+
+    # Pass 2: White Circle Check Content API
+    if WHITE_CIRCLE_API_KEY and WHITE_CIRCLE_DEPLOYMENT_ID:
+        try:
+            result = check_content(**_white_circle_kwargs(command_json, session_id, timestamp))
+            return _white_circle_verdict(result, command_json, session_id, timestamp)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("White Circle API error: %s", exc)
+
+    # Pass 3: fallback
+    return _fallback_verdict(command_json, session_id, timestamp)
+
+
+async def validate_command_async(
+    command_json: dict,
+    session_id: str,
+    client: httpx.AsyncClient,
+) -> dict:
+    """Async :func:`validate_command`; the White Circle call uses *client*."""
+    timestamp = datetime.now(timezone.utc).isoformat()
+
+    blocked = _local_verdict(command_json, session_id, timestamp)
+    if blocked is not None:
+        return blocked
+
+    if WHITE_CIRCLE_API_KEY and WHITE_CIRCLE_DEPLOYMENT_ID:
+        try:
+            result = await check_content_async(
+                client, **_white_circle_kwargs(command_json, session_id, timestamp),
+            )
+            return _white_circle_verdict(result, command_json, session_id, timestamp)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("White Circle API error: %s", exc)
+
+    return _fallback_verdict(command_json, session_id, timestamp)
+
+
 def format_rejection_message(violation_tags: list[str]) -> str:
+    return _rejection_message(tuple(violation_tags))
+
+
+# Rejections repeat the same few tag combinations, so each message is built once.
+@lru_cache(maxsize=256)
+def _rejection_message(violation_tags: tuple[str, ...]) -> str:
     tags_str = ", ".join(violation_tags) if violation_tags else "UNKNOWN"
     return (
         f"SECURITY ALERT: Command blocked due to [{tags_str}]. "
@@ -3,19 +3,30 @@ Vyuha AI — Spacecraft State Manager
 ====================================
 File-based persistent state for position, trajectory, and maneuver history.
 Works with Blaxel agent deployment (writable filesystem in container).
+
+The current state (position, velocity, trajectories, last maneuver) is a
+small JSON document replaced atomically on every save; the maneuver history
+lives in an append-only JSON Lines journal, so a save writes only the
+maneuvers recorded since the previous one.
 """
 
 from __future__ import annotations
 
-import json
+import os
 import threading
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 _LOCK = threading.Lock()
 _DATA_DIR = Path(__file__).resolve().parents[1] / "data"
 _STATE_FILE = _DATA_DIR / "spacecraft_state.json"
+_HISTORY_FILE = _DATA_DIR / "maneuver_history.jsonl"
+# Number of maneuver records currently in _HISTORY_FILE (guarded by _LOCK);
+# None until counted, either by load_state() or by the first save.
+_journaled: int | None = None
 
 _DEFAULT_STATE: dict[str, Any] = {
     "position": {"lat": 0.0, "lon": 0.0, "alt_km": 400.0},
@@ -35,39 +46,99 @@ def _now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
 
+def _read_history() -> list[dict[str, Any]] | None:
+    """Return the journaled maneuvers, or ``None`` if there is no journal.
+
+    A torn final record (a crash mid-append) is cut off the file, so the
+    next append starts on a fresh line instead of extending the torn one.
+    """
+    try:
+        data = _HISTORY_FILE.read_bytes()
+    except FileNotFoundError:
+        return None
+    if data and not data.endswith(b"\n"):
+        data = data[:data.rfind(b"\n") + 1]
+        os.truncate(_HISTORY_FILE, len(data))
+    history = []
+    for line in data.splitlines():
+        try:
+            history.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            continue  # corrupt or blank line
+    return history
+
+
+def _journal_history(history: list[dict[str, Any]]) -> None:
+    """Bring the journal in line with *history* (caller holds ``_LOCK``).
+
+    History only grows between resets, so normally just the records added
+    since the last load or save are appended; a shorter history means it
+    was reset and the journal is rewritten.
+    """
+    global _journaled
+    # Saving without a prior load (e.g. a reset) cannot know how the journal
+    # relates to *history*, so it is rewritten rather than appended to.
+    if _journaled is None or len(history) < _journaled:
+        mode, pending = "wb", history
+    else:
+        mode, pending = "ab", history[_journaled:]
+    if pending or mode == "wb":
+        with _HISTORY_FILE.open(mode) as fh:
+            fh.write(b"".join(orjson.dumps(record) + b"\n" for record in pending))
+    _journaled = len(history)
+
+
 def load_state() -> dict[str, Any]:
     """Load spacecraft state from disk. Returns default if missing or invalid."""
+    global _journaled
     _ensure_dir()
-    if not _STATE_FILE.exists():
-        state = _DEFAULT_STATE.copy()
-        state["updated_at"] = _now_iso()
-        return state
     with _LOCK:
+        history = _read_history()
+        _journaled = len(history) if history is not None else 0
+        if not _STATE_FILE.exists():
+            state = _DEFAULT_STATE.copy()
+            state["updated_at"] = _now_iso()
+            state["maneuver_history"] = history or []
+            return state
         try:
-            raw = _STATE_FILE.read_text(encoding="utf-8")
-            data = json.loads(raw)
+            data = orjson.loads(_STATE_FILE.read_bytes())
             if isinstance(data, dict):
-                data.setdefault("maneuver_history", [])
+                if history is not None:
+                    data["maneuver_history"] = history
+                else:
+                    # Older saves kept the history inline; the next save
+                    # moves it into the journal.
+                    data.setdefault("maneuver_history", [])
                 data.setdefault("original_trajectory", None)
                 data.setdefault("last_maneuver", None)
                 data.setdefault("position", _DEFAULT_STATE["position"])
                 data.setdefault("velocity", _DEFAULT_STATE["velocity"])
                 return data
-        except (json.JSONDecodeError, OSError):
+        except (orjson.JSONDecodeError, OSError):
             pass
-    return _DEFAULT_STATE.copy()
+    state = _DEFAULT_STATE.copy()
+    state["maneuver_history"] = history or []
+    return state
 
 
 def save_state(state: dict[str, Any]) -> None:
-    """Persist spacecraft state to disk."""
+    """Persist spacecraft state to disk.
+
+    New maneuvers are appended to the history journal; the rest of the state
+    is written to a temporary file and swapped in with ``os.replace``.
+    """
     _ensure_dir()
     state = dict(state)
+    history = state.pop("maneuver_history", None) or []
     state["updated_at"] = _now_iso()
+    tmp = _STATE_FILE.with_suffix(".json.tmp")
     with _LOCK:
-        _STATE_FILE.write_text(
-            json.dumps(state, indent=2),
-            encoding="utf-8",
+        _journal_history(history)
+        # Orbit Engine reports may carry NumPy scalars straight into position
+        tmp.write_bytes(
+            orjson.dumps(state, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY),
         )
+        os.replace(tmp, _STATE_FILE)
 
 
 def apply_maneuver(
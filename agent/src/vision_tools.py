@@ -14,7 +14,10 @@ import logging
 import os
 import time
 
+import httpx
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -27,6 +30,11 @@ OVERSHOOT_BASE_URL: str = os.getenv(
 )
 OVERSHOOT_MODEL: str = "Qwen/Qwen3-VL-8B-Instruct"
 
+# Pooled keep-alive session so repeat scans skip the TCP/TLS handshake.
+# No retries: a slow vision call already falls back to simulation.
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=2, pool_maxsize=16))
+
 DEFAULT_VIDEO_URL: str = (
     "https://cdn.pixabay.com/video/2019/04/20/22906-331767667_large.mp4"
 )
@@ -48,6 +56,66 @@ SIMULATED_REPORT: str = (
 )
 
 
+def _report(description: str, source: str, url: str, started: float) -> dict:
+    return {
+        "description": description,
+        "source": source,
+        "video_url": url,
+        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
+    }
+
+
+def _overshoot_request(url: str) -> tuple[str, dict[str, str], bytes]:
+    """Return ``(endpoint, headers, body)`` for an Overshoot chat completion."""
+    payload = {
+        "model": OVERSHOOT_MODEL,
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": VISION_PROMPT},
+                    {
+                        "type": "video_url",
+                        "video_url": {"url": url},
+                    },
+                ],
+            }
+        ],
+        "max_tokens": 512,
+        "temperature": 0.3,
+    }
+    headers = {
+        "Authorization": f"Bearer {OVERSHOOT_API_KEY}",
+        "Content-Type": "application/json",
+    }
+    return f"{OVERSHOOT_BASE_URL}/chat/completions", headers, orjson.dumps(payload)
+
+
+def _overshoot_report(
+    ok: bool, status_code: int, body: bytes, url: str, started: float,
+) -> dict:
+    """Turn an Overshoot response into a report, or fall back to simulation."""
+    if ok:
+        data = orjson.loads(body)
+        content = (
+            data.get("choices", [{}])[0]
+            .get("message", {})
+            .get("content", "")
+        )
+        if content.strip():
+            logger.info(
+                "Overshoot visual analysis complete (%d chars)",
+                len(content),
+            )
+            return _report(content.strip(), "overshoot_ai", url, started)
+
+    logger.warning(
+        "Overshoot API returned %s — falling back to simulation",
+        status_code,
+    )
+    return _report(SIMULATED_REPORT, "simulation", url, started)
+
+
 def analyze_visual_feed(video_url: str | None = None) -> dict:
     """Analyze a video feed for space debris using Overshoot AI.
 
@@ -67,77 +135,38 @@ def analyze_visual_feed(video_url: str | None = None) -> dict:
 
     if not OVERSHOOT_API_KEY:
         logger.warning("OVERSHOOT_API_KEY not set — returning simulated visual report")
-        return {
-            "description": SIMULATED_REPORT,
-            "source": "simulation",
-            "video_url": url,
-            "latency_ms": round((time.perf_counter() - started) * 1000, 2),
-        }
+        return _report(SIMULATED_REPORT, "simulation", url, started)
 
     try:
-        payload = {
-            "model": OVERSHOOT_MODEL,
-            "messages": [
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": VISION_PROMPT},
-                        {
-                            "type": "video_url",
-                            "video_url": {"url": url},
-                        },
-                    ],
-                }
-            ],
-            "max_tokens": 512,
-            "temperature": 0.3,
-        }
-
-        resp = requests.post(
-            f"{OVERSHOOT_BASE_URL}/chat/completions",
-            headers={
-                "Authorization": f"Bearer {OVERSHOOT_API_KEY}",
-                "Content-Type": "application/json",
-            },
-            json=payload,
-            timeout=30,
-        )
+        endpoint, headers, body = _overshoot_request(url)
+        resp = _HTTP_SESSION.post(endpoint, headers=headers, data=body, timeout=30)
+        return _overshoot_report(resp.ok, resp.status_code, resp.content, url, started)
+    except Exception as exc:
+        logger.warning("Overshoot API error: %s — falling back to simulation", exc)
+
+    return _report(SIMULATED_REPORT, "simulation", url, started)
 
-        if resp.ok:
-            data = resp.json()
-            content = (
-                data.get("choices", [{}])[0]
-                .get("message", {})
-                .get("content", "")
-            )
-            if content.strip():
-                logger.info(
-                    "Overshoot visual analysis complete (%d chars)",
-                    len(content),
-                )
-                return {
-                    "description": content.strip(),
-                    "source": "overshoot_ai",
-                    "video_url": url,
-                    "latency_ms": round(
-                        (time.perf_counter() - started) * 1000, 2
-                    ),
-                }
-
-        logger.warning(
-            "Overshoot API returned %s — falling back to simulation",
-            resp.status_code,
-        )
 
+async def analyze_visual_feed_async(
+    client: httpx.AsyncClient,
+    video_url: str | None = None,
+) -> dict:
+    """Async :func:`analyze_visual_feed` over a caller-owned, pooled *client*."""
+    url = video_url or DEFAULT_VIDEO_URL
+    started = time.perf_counter()
+
+    if not OVERSHOOT_API_KEY:
+        logger.warning("OVERSHOOT_API_KEY not set — returning simulated visual report")
+        return _report(SIMULATED_REPORT, "simulation", url, started)
+
+    try:
+        endpoint, headers, body = _overshoot_request(url)
+        resp = await client.post(endpoint, headers=headers, content=body, timeout=30)
+        return _overshoot_report(resp.is_success, resp.status_code, resp.content, url, started)
     except Exception as exc:
         logger.warning("Overshoot API error: %s — falling back to simulation", exc)
 
-    return {
-        "description": SIMULATED_REPORT,
-        "source": "simulation",
-        "video_url": url,
-        "latency_ms": round((time.perf_counter() - started) * 1000, 2),
-    }
+    return _report(SIMULATED_REPORT, "simulation", url, started)
 
 
 if __name__ == "__main__":
@@ -1022,11 +1022,11 @@ elif triggered:
                         )
                         add_log("   ↳ Commander self-correcting (feedback loop)...", "warn")
 
-                for wf in act_data.get("workflow_trace", []):
+                for wf in act_data.get("attempts_log", []):
                     st.caption(
                         "Attempt "
                         f"{wf.get('attempt')} | latency={wf.get('attempt_latency_ms')} ms | "
-                        f"validator={wf.get('validation_source')}"
+                        f"validator={wf.get('validation', {}).get('source')}"
                     )
 
         # ── Result banner ─────────────────────────────────────────────
@@ -0,0 +1,51 @@
+"""Shared pytest setup: import path, offline env, isolated runtime data."""
+
+from __future__ import annotations
+
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT))
+
+# main.py refuses to import without a Blaxel key; tests never reach Blaxel.
+os.environ.setdefault("BLAXEL_API_KEY", "test")
+os.environ.setdefault("WARMUP_ON_STARTUP", "false")
+
+
+@pytest.fixture
+def state_dir(tmp_path, monkeypatch):
+    """Point state_manager at an empty temporary data directory."""
+    from agent.src import state_manager
+
+    monkeypatch.setattr(state_manager, "_DATA_DIR", tmp_path)
+    monkeypatch.setattr(state_manager, "_STATE_FILE", tmp_path / "spacecraft_state.json")
+    monkeypatch.setattr(state_manager, "_HISTORY_FILE", tmp_path / "maneuver_history.jsonl")
+    monkeypatch.setattr(state_manager, "_journaled", None)
+    monkeypatch.setattr(state_manager, "_state", {})
+    return tmp_path
+
+
+@pytest.fixture
+def events_dir(tmp_path, monkeypatch):
+    """Point learning_engine at an empty event store; drive the writer inline."""
+    import queue
+
+    from agent.src import learning_engine
+
+    events_file = tmp_path / "agent_events.jsonl"
+    monkeypatch.setattr(learning_engine, "_DATA_DIR", tmp_path)
+    monkeypatch.setattr(learning_engine, "_EVENTS_FILE", events_file)
+    monkeypatch.setattr(learning_engine, "_ROTATED_FILE", events_file.with_suffix(".jsonl.1"))
+    monkeypatch.setattr(learning_engine, "_events_fd", None)
+    monkeypatch.setattr(learning_engine, "_AGG", None)
+    monkeypatch.setattr(learning_engine, "_INSIGHTS_CACHE", None)
+    monkeypatch.setattr(learning_engine, "_write_queue", queue.Queue())
+    # No background thread: tests call _drain_writes() after a None sentinel
+    monkeypatch.setattr(learning_engine, "_start_writer", lambda: None)
+    yield tmp_path
+    if learning_engine._events_fd is not None:
+        os.close(learning_engine._events_fd)
@@ -0,0 +1,181 @@
+"""HTTP contract of the batch scan, streaming agent loop and validated-plan cache."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from agent.src import commander, main, orbit_tools, security
+
+FROZEN_UTC = datetime(2026, 1, 1, 12, 34, 56, tzinfo=timezone.utc)
+
+# What the LLM answers on a Shield-driven retry (the fast path never retries)
+RETRY_PLAN = {
+    "action": "FIRE_THRUSTERS",
+    "reasoning": "Previous plan blocked; a prograde burn moves away from the debris.",
+    "confidence_score": 0.9,
+    "recommended_thrust_direction": "PROGRADE",
+}
+
+
+class _FrozenDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FROZEN_UTC if tz is not None else FROZEN_UTC.replace(tzinfo=None)
+
+
+@pytest.fixture
+def client(state_dir, events_dir, monkeypatch):
+    """App client that stays offline and writes only to temporary stores."""
+    events: list[tuple[str, dict]] = []
+    monkeypatch.setattr(main, "record_event", lambda kind, data: events.append((kind, data)))
+    monkeypatch.setattr(security, "WHITE_CIRCLE_API_KEY", "")
+
+    def _offline() -> tuple[str, str]:
+        raise OSError("offline")
+
+    async def _complete(messages, params=None) -> str:
+        return orjson.dumps(RETRY_PLAN).decode()
+
+    monkeypatch.setattr(orbit_tools, "fetch_live_tle", _offline)
+    monkeypatch.setattr(commander, "_complete_with_retry", _complete)
+    # The state queue binds to the first event loop that waits on it; every
+    # TestClient runs its own loop.
+    monkeypatch.setattr(main, "_STATE_Q", asyncio.Queue(maxsize=1))
+    with TestClient(main.app) as test_client:
+        test_client.events = events
+        yield test_client
+
+
+@pytest.fixture
+def frozen_clock(monkeypatch):
+    """Pin both the propagation epoch and the wall clock to ``FROZEN_UTC``."""
+    frozen = orbit_tools.ts.from_datetime(FROZEN_UTC)
+    monkeypatch.setattr(orbit_tools.ts, "now", lambda: frozen)
+    monkeypatch.setattr(orbit_tools, "datetime", _FrozenDatetime)
+
+
+def _sse_events(body: str) -> list[tuple[str, dict]]:
+    events = []
+    for frame in body.strip().split("\n\n"):
+        kind_line, data_line = frame.split("\n")
+        events.append((kind_line.removeprefix("event: "), orjson.loads(data_line.removeprefix("data: "))))
+    return events
+
+
+def test_scan_batch_matches_scalar_scan_at_same_epoch(client, frozen_clock):
+    response = client.post("/scan_batch", json={"satellite_id": "ISS", "epoch_minutes": [0.0]})
+    assert response.status_code == 200
+    [batch] = response.json()["reports"]
+
+    scalar = orbit_tools.check_conjunction_risk()
+
+    assert batch["epoch_offset_min"] == 0.0
+    assert batch["latitude"] == pytest.approx(scalar["latitude"], abs=1e-4)
+    assert batch["longitude"] == pytest.approx(scalar["longitude"], abs=1e-4)
+    assert batch["altitude_km"] == pytest.approx(scalar["altitude_km"], abs=1e-3)
+    for key in (
+        "collision_probability", "distance_to_debris_km", "status",
+        "scenario_mode", "data_source",
+    ):
+        assert batch[key] == scalar[key], key
+
+
+def test_scan_batch_reports_follow_input_order(client, frozen_clock):
+    minutes = [30.0, 0.0, 90.0]
+    response = client.post("/scan_batch", json={"satellite_id": "ISS", "epoch_minutes": minutes})
+    assert response.status_code == 200
+    reports = response.json()["reports"]
+
+    assert [report["epoch_offset_min"] for report in reports] == minutes
+    assert len({report["longitude"] for report in reports}) == len(minutes)
+
+
+def test_act_stream_emits_attempts_then_act_result(client):
+    request = {
+        "risk_data": {"status": "CRITICAL", "collision_probability": 0.95},
+        "session_id": "stream-test",
+        "simulate_cyberattack": True,
+    }
+    response = client.post("/act/stream", json=request)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/event-stream")
+
+    events = _sse_events(response.text)
+    kinds = [kind for kind, _ in events]
+    assert kinds == ["attempt", "attempt", "result"]
+
+    blocked, executed = events[0][1], events[1][1]
+    assert blocked["validation"]["valid"] is False
+    assert executed["validation"]["valid"] is True
+    assert executed["command"] == RETRY_PLAN
+
+    result = events[-1][1]
+    assert result["status"] == "EXECUTED"
+    assert result["attempts"] == 2
+    assert result["attempts_log"] == [blocked, executed]
+    assert [kind for kind, _ in client.events] == ["act"]
+
+
+def test_act_stream_rejects_malformed_body_before_streaming(client):
+    response = client.post("/act/stream", json={"session_id": "no-risk-data"})
+    assert response.status_code == 422
+
+
+@pytest.fixture
+def plan_cache(monkeypatch):
+    """An empty validated-plan cache, isolated from other tests."""
+    cache = main.OrderedDict()
+    monkeypatch.setattr(main, "_plan_cache", cache)
+    monkeypatch.setattr(commander, "_decision_cache", commander.OrderedDict())
+    return cache
+
+
+def test_plan_cache_entries_expire(plan_cache):
+    main._plan_cache_put("k", RETRY_PLAN, {"valid": True})
+    assert main._plan_cache_get("k") == (RETRY_PLAN, {"valid": True})
+
+    stored_at, command, validation = plan_cache["k"]
+    plan_cache["k"] = (stored_at - main.PLAN_CACHE_TTL_S - 1, command, validation)
+
+    assert main._plan_cache_get("k") is None
+    assert "k" not in plan_cache
+
+
+def test_plan_cache_evicts_least_recently_used(plan_cache, monkeypatch):
+    monkeypatch.setattr(main, "PLAN_CACHE_SIZE", 2)
+    main._plan_cache_put("a", RETRY_PLAN, {"valid": True})
+    main._plan_cache_put("b", RETRY_PLAN, {"valid": True})
+    main._plan_cache_get("a")  # a is now the most recent
+    main._plan_cache_put("c", RETRY_PLAN, {"valid": True})
+
+    assert list(plan_cache) == ["a", "c"]
+
+
+def test_act_never_replays_a_safety_fallback(client, plan_cache, monkeypatch):
+    calls = []
+
+    async def gateway_down_then_up(messages, params=None):
+        calls.append(messages)
+        if len(calls) == 1:
+            raise ConnectionError("gateway down")
+        return orjson.dumps(RETRY_PLAN).decode()
+
+    monkeypatch.setattr(commander, "_complete_with_retry", gateway_down_then_up)
+    request = {
+        "risk_data": {"status": "WARNING", "collision_probability": 0.61, "altitude_km": 400.0},
+        "session_id": "plan-cache-test",
+    }
+
+    first = client.post("/act", json=request).json()
+    assert commander.is_safety_fallback(first["final_command"])
+    assert not plan_cache
+
+    second = client.post("/act", json=request).json()
+    assert second["final_command"] == RETRY_PLAN
+    assert len(calls) == 2
+    assert len(plan_cache) == 1
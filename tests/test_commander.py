@@ -0,0 +1,148 @@
+"""Commander: LLM retry policy and decision-path telemetry."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import orjson
+import pytest
+
+from agent.src import commander
+
+PLAN = {
+    "action": "HOLD_POSITION",
+    "reasoning": "Probability is in the grey zone; hold.",
+    "confidence_score": 0.6,
+    "recommended_thrust_direction": "NONE",
+}
+
+
+class _FakeBLModel:
+    async def get_parameters(self):
+        return "https://gateway.test", "openai", "test-model"
+
+
+@pytest.fixture
+def gateway(monkeypatch):
+    """Route the primary path to a scripted gateway; forbid the sync fallback."""
+    statuses: list[int] = []
+    seen: list[int] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        status = statuses.pop(0) if statuses else 200
+        seen.append(status)
+        if status != 200:
+            return httpx.Response(status, request=request)
+        body = {"choices": [{"message": {"content": orjson.dumps(PLAN).decode()}}]}
+        return httpx.Response(200, json=body, request=request)
+
+    def no_sync_fallback(*args, **kwargs):
+        raise AssertionError("gateway errors must not fall back to the sync client")
+
+    monkeypatch.setattr(commander, "_bl_model", _FakeBLModel())
+    monkeypatch.setattr(
+        commander, "_get_async_http",
+        lambda: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    monkeypatch.setattr(commander, "_call_llm_sync", no_sync_fallback)
+    monkeypatch.setattr(commander, "_RETRY_BASE_DELAY_S", 0.0)
+    return statuses, seen
+
+
+def _complete() -> str:
+    return asyncio.run(commander._complete_with_retry([{"role": "user", "content": "x"}]))
+
+
+@pytest.mark.parametrize("status", [429, 503])
+def test_transient_gateway_status_is_retried(gateway, status):
+    statuses, seen = gateway
+    statuses.extend([status, status])
+
+    assert orjson.loads(_complete()) == PLAN
+    assert seen == [status, status, 200]
+
+
+def test_client_error_is_not_retried(gateway):
+    statuses, seen = gateway
+    statuses.append(400)
+
+    with pytest.raises(httpx.HTTPStatusError):
+        _complete()
+    assert seen == [400]
+
+
+def test_unavailable_blmodel_uses_sync_client(monkeypatch):
+    monkeypatch.setattr(commander, "_bl_model", None)
+    monkeypatch.setattr(commander, "_call_llm_sync", lambda messages, params: "sync")
+
+    assert _complete() == "sync"
+
+
+def test_decisions_record_which_path_answered(monkeypatch):
+    recorded = []
+    monkeypatch.setattr(commander, "record_event", lambda kind, data: recorded.append((kind, data)))
+
+    async def answer(messages, params=None):
+        return orjson.dumps(PLAN).decode()
+
+    monkeypatch.setattr(commander, "_complete_with_retry", answer)
+    asyncio.run(commander.analyze_situation_async({"collision_probability": 0.95}))
+    asyncio.run(commander.analyze_situation_async({"collision_probability": 0.61, "altitude_km": 400.0}))
+
+    assert [(kind, data["fast_path"]) for kind, data in recorded] == [("act", True), ("act", False)]
+
+
+@pytest.fixture
+def decision_cache(monkeypatch):
+    """An empty decision cache, isolated from other tests."""
+    cache = commander.OrderedDict()
+    monkeypatch.setattr(commander, "_decision_cache", cache)
+    monkeypatch.setattr(commander, "record_event", lambda kind, data: None)
+    return cache
+
+
+def test_decision_cache_entries_expire(decision_cache):
+    commander._decision_cache_put(("k",), orjson.dumps(PLAN).decode())
+    assert commander._decision_cache_get(("k",)) == PLAN
+
+    stored_at, raw = decision_cache[("k",)]
+    decision_cache[("k",)] = (stored_at - commander.DECISION_CACHE_TTL_S - 1, raw)
+
+    assert commander._decision_cache_get(("k",)) is None
+    assert ("k",) not in decision_cache
+
+
+def test_decision_cache_evicts_least_recently_used(decision_cache, monkeypatch):
+    monkeypatch.setattr(commander, "DECISION_CACHE_SIZE", 2)
+    raw = orjson.dumps(PLAN).decode()
+    commander._decision_cache_put(("a",), raw)
+    commander._decision_cache_put(("b",), raw)
+    commander._decision_cache_get(("a",))  # a is now the most recent
+    commander._decision_cache_put(("c",), raw)
+
+    assert list(decision_cache) == [("a",), ("c",)]
+
+
+def test_safety_fallback_is_never_cached(decision_cache, monkeypatch):
+    replies = [ConnectionError("gateway down"), '{"action": "HOLD_POSITION"}']
+    calls = []
+
+    async def flaky(messages, params=None):
+        calls.append(messages)
+        reply = replies.pop(0) if replies else orjson.dumps(PLAN).decode()
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    monkeypatch.setattr(commander, "_complete_with_retry", flaky)
+    risk = {"collision_probability": 0.61, "altitude_km": 400.0, "status": "WARNING"}
+
+    first = asyncio.run(commander.analyze_situation_async(risk))  # LLM error
+    second = asyncio.run(commander.analyze_situation_async(risk))  # missing keys
+    assert commander.is_safety_fallback(first) and commander.is_safety_fallback(second)
+    assert not decision_cache
+
+    assert asyncio.run(commander.analyze_situation_async(risk)) == PLAN
+    assert asyncio.run(commander.analyze_situation_async(risk)) == PLAN  # cached
+    assert len(calls) == 3
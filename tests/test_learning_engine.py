@@ -0,0 +1,111 @@
+"""Event writer resilience and insight aggregation."""
+
+from __future__ import annotations
+
+import os
+
+import orjson
+
+from agent.src import learning_engine
+
+
+def _scan(latency_ms: float = 10.0, **payload) -> None:
+    learning_engine.record_event("scan", {"latency_ms": latency_ms, **payload})
+
+
+def _drain() -> None:
+    learning_engine._enqueue(None)
+    learning_engine._drain_writes()
+
+
+def _stored_events(events_dir) -> list[dict]:
+    lines = (events_dir / "agent_events.jsonl").read_bytes().splitlines()
+    return [orjson.loads(line) for line in lines]
+
+
+def test_writer_survives_a_failed_batch(events_dir, monkeypatch, caplog):
+    monkeypatch.setattr(learning_engine, "_MAX_WRITE_BATCH", 1)
+    real_append = learning_engine._append_lines
+    calls = []
+
+    def flaky_append(lines):
+        calls.append(lines)
+        if len(calls) == 1:
+            raise OSError(28, "No space left on device")
+        real_append(lines)
+
+    monkeypatch.setattr(learning_engine, "_append_lines", flaky_append)
+    _scan(1.0)
+    _scan(2.0)
+    _drain()  # returns only once the sentinel is reached
+
+    assert "dropped a batch of 1 events" in caplog.text
+    assert [e["payload"]["latency_ms"] for e in _stored_events(events_dir)] == [2.0]
+    # The aggregate agrees with the store, not with what was attempted
+    assert learning_engine.get_insights()["summary"]["scan_events"] == 1
+
+
+def test_short_writes_are_completed(events_dir, monkeypatch):
+    real_write = os.write
+    _scan(1.0)
+    _scan(2.0)
+    with monkeypatch.context() as patch:
+        patch.setattr(os, "write", lambda fd, data: real_write(fd, bytes(data[:7])))
+        _drain()
+
+    assert [e["payload"]["latency_ms"] for e in _stored_events(events_dir)] == [1.0, 2.0]
+
+
+def test_decision_records_are_split_out_of_act_counts(events_dir):
+    learning_engine.record_event("act", {"status": "EXECUTED", "latency_ms": 5.0})
+    learning_engine.record_event("act", {"fast_path": True, "action": "FIRE_THRUSTERS"})
+    learning_engine.record_event("act", {"fast_path": False, "action": "HOLD_POSITION"})
+    _drain()
+
+    summary = learning_engine.get_insights()["summary"]
+    assert summary["act_events"] == summary["total_events"] == 1
+    assert summary["fast_path_decisions"] == 1
+    assert summary["llm_decisions"] == 1
+
+    learning_engine._AGG = None  # restart: rebuilt from the store
+    learning_engine._INSIGHTS_CACHE = None
+    summary = learning_engine.get_insights()["summary"]
+    assert (summary["fast_path_decisions"], summary["llm_decisions"]) == (1, 1)
+
+
+def test_counter_change_invalidates_cached_insights(events_dir, monkeypatch):
+    monkeypatch.setattr(learning_engine, "_INSIGHTS_TTL_S", 0.0)
+    monkeypatch.setattr(learning_engine, "_COUNTERS", learning_engine.Counter())
+    _scan()
+    _drain()
+    assert "llm_retries" not in learning_engine.get_insights()["runtime_counters"]
+
+    learning_engine.count("llm_retries")
+
+    assert learning_engine.get_insights()["runtime_counters"]["llm_retries"] == 1
+
+
+def test_python_and_numpy_aggregates_agree():
+    events = [
+        {"event_type": "scan", "payload": {"latency_ms": 12, "scenario_mode": "LIVE_OBSERVATION"}},
+        {"event_type": "scan", "payload": {"latency_ms": 8, "scenario_mode": None}},
+        {"event_type": "scan", "payload": {"latency_ms": 9}},
+        {"event_type": "scan", "payload": {"latency_ms": 3, "status": "ERROR", "scenario_mode": 7}},
+        {"event_type": "act", "payload": {
+            "status": "EXECUTED", "latency_ms": 40,
+            "attempts_log": [
+                {"validation": {"valid": False, "source": "local_deny_list", "violation_tags": ["ATTACK"]}},
+                {"validation": {"valid": True, "source": "fallback", "violation_tags": []}},
+            ],
+        }},
+        {"event_type": "act", "payload": {"status": "MANUAL_OVERRIDE_REQUIRED", "latency_ms": 90}},
+        {"event_type": "act", "payload": {"fast_path": True, "action": "FIRE_THRUSTERS"}},
+        {"event_type": "act", "payload": {"fast_path": False, "action": "HOLD_POSITION"}},
+        {"event_type": "unknown", "payload": {}},
+    ]
+
+    python_agg = learning_engine._aggregate_python(events)
+    numpy_agg = learning_engine._aggregate_numpy(events)
+
+    assert python_agg == numpy_agg
+    assert python_agg["scenario_counter"] == {"LIVE_OBSERVATION": 1, "UNKNOWN": 2, "7": 1}
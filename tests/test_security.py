@@ -0,0 +1,58 @@
+"""Shield pass 1: the local deny-list scan."""
+
+from __future__ import annotations
+
+import pytest
+
+from agent.src import security
+
+SAFE_COMMAND = {
+    "action": "FIRE_THRUSTERS",
+    "reasoning": "Collision probability 0.95 exceeds the threshold; prograde burn.",
+    "confidence_score": 0.95,
+    "recommended_thrust_direction": "PROGRADE",
+}
+
+
+@pytest.fixture(autouse=True)
+def local_only(monkeypatch):
+    """Keep White Circle out of the verdict; pass 3 is the local fallback."""
+    monkeypatch.setattr(security, "WHITE_CIRCLE_API_KEY", "")
+
+
+def _verdict(command: dict) -> dict:
+    return security.validate_command(command, "test-session")
+
+
+def test_safe_command_has_no_violations():
+    verdict = _verdict(SAFE_COMMAND)
+    assert verdict["valid"] is True
+    assert verdict["source"] == "fallback"
+    assert verdict["violation_tags"] == []
+
+
+def test_overlapping_keywords_are_all_reported():
+    verdict = _verdict({**SAFE_COMMAND, "action": "SELF_DESTRUCT"})
+    assert verdict["valid"] is False
+    assert verdict["source"] == "local_deny_list"
+    assert verdict["violation_tags"] == ["DESTRUCT", "SELF_DESTRUCT"]
+
+
+def test_lowercase_keywords_are_caught():
+    verdict = _verdict({**SAFE_COMMAND, "reasoning": "then de-orbit and weaponize it"})
+    assert verdict["violation_tags"] == ["DE-ORBIT", "WEAPONIZE"]
+
+
+def test_keywords_in_dict_keys_are_caught():
+    verdict = _verdict({**SAFE_COMMAND, "parameters": {"attack_vector": "none"}})
+    assert verdict["violation_tags"] == ["ATTACK"]
+
+
+def test_keywords_in_nested_lists_are_caught():
+    command = {**SAFE_COMMAND, "sequence": [["HOLD_POSITION"], [{"step": "disable_shield"}]]}
+    assert _verdict(command)["violation_tags"] == ["DISABLE_SHIELD"]
+
+
+def test_non_string_values_are_ignored():
+    command = {**SAFE_COMMAND, "burns": [1, 2.5, None, True], "meta": {"n": 3}}
+    assert _verdict(command)["valid"] is True
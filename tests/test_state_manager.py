@@ -0,0 +1,81 @@
+"""Maneuver-history journal and legacy-state migration."""
+
+from __future__ import annotations
+
+import orjson
+
+from agent.src import state_manager
+
+
+def _journal_actions(state_dir) -> list[str]:
+    path = state_dir / "maneuver_history.jsonl"
+    return [orjson.loads(line)["action"] for line in path.read_bytes().splitlines()]
+
+
+def _maneuver(state: dict, action: str) -> dict:
+    return state_manager.apply_maneuver(state, {"latitude": 1.0}, {"action": action})
+
+
+def test_save_appends_only_new_maneuvers(state_dir):
+    state = state_manager.load_state()
+    for action in ("A", "B"):
+        state = _maneuver(state, action)
+        state_manager.save_state(state)
+    state_manager.save_state(state)  # no new maneuvers → nothing appended
+
+    assert _journal_actions(state_dir) == ["A", "B"]
+    on_disk = orjson.loads((state_dir / "spacecraft_state.json").read_bytes())
+    assert "maneuver_history" not in on_disk
+    assert on_disk["last_maneuver"]["action"] == "B"
+
+
+def test_load_rebuilds_history_from_journal(state_dir):
+    state = _maneuver(state_manager.load_state(), "A")
+    state_manager.save_state(state)
+    state_manager._journaled = None  # fresh process
+
+    loaded = state_manager.load_state()
+    assert [m["action"] for m in loaded["maneuver_history"]] == ["A"]
+
+    state_manager.save_state(_maneuver(loaded, "B"))
+    assert _journal_actions(state_dir) == ["A", "B"]
+
+
+def test_reset_without_prior_load_truncates_journal(state_dir):
+    state = _maneuver(state_manager.load_state(), "A")
+    state_manager.save_state(state)
+    state_manager._journaled = None  # fresh process that never loaded state
+
+    state_manager.reset_state_to_default()
+
+    assert _journal_actions(state_dir) == []
+    assert state_manager.load_state()["maneuver_history"] == []
+
+
+def test_legacy_inline_history_moves_to_journal(state_dir):
+    (state_dir / "spacecraft_state.json").write_bytes(orjson.dumps({
+        "position": {"lat": 1.0, "lon": 2.0, "alt_km": 400.0},
+        "maneuver_history": [{"action": "OLD"}],
+    }))
+
+    state = state_manager.load_state()
+    assert state["maneuver_history"] == [{"action": "OLD"}]
+
+    state_manager.save_state(_maneuver(state, "NEW"))
+    assert _journal_actions(state_dir) == ["OLD", "NEW"]
+
+
+def test_torn_journal_line_is_dropped_before_next_append(state_dir):
+    state_manager.save_state(_maneuver(state_manager.load_state(), "A"))
+    with (state_dir / "maneuver_history.jsonl").open("ab") as fh:
+        fh.write(b'{"action": "B"')  # crash mid-append
+
+    state_manager._journaled = None
+    state = state_manager.load_state()
+    assert [m["action"] for m in state["maneuver_history"]] == ["A"]
+
+    state_manager.save_state(_maneuver(state, "C"))
+    assert _journal_actions(state_dir) == ["A", "C"]
+
+    state_manager._journaled = None
+    assert [m["action"] for m in state_manager.load_state()["maneuver_history"]] == ["A", "C"]